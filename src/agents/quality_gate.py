@@ -25,6 +25,13 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Structure check patterns, compiled once
+_H2_RE = re.compile(r'<h2', re.IGNORECASE)
+_H3_RE = re.compile(r'<h3', re.IGNORECASE)
+_LIST_RE = re.compile(r'<[uo]l>', re.IGNORECASE)
+_IMG_RE = re.compile(r'<img', re.IGNORECASE)
+_LINK_RE = re.compile(r'<a\s', re.IGNORECASE)
+
 
 @dataclass
 class QualityCheck:
@@ -384,8 +391,8 @@ class QualityGateAgent(BaseAgent):
         issues = []
         
         # Check for headings
-        h2_count = len(re.findall(r'<h2', content, re.IGNORECASE))
-        h3_count = len(re.findall(r'<h3', content, re.IGNORECASE))
+        h2_count = len(_H2_RE.findall(content))
+        h3_count = len(_H3_RE.findall(content))
         
         if h2_count >= 3:
             score += 15
@@ -393,21 +400,21 @@ class QualityGateAgent(BaseAgent):
             issues.append(f"Only {h2_count} H2 headings (recommend 3+)")
         
         # Check for lists
-        list_count = len(re.findall(r'<[uo]l>', content, re.IGNORECASE))
+        list_count = len(_LIST_RE.findall(content))
         if list_count >= 2:
             score += 10
         else:
             issues.append(f"Only {list_count} lists (recommend 2+)")
         
         # Check for images
-        img_count = len(re.findall(r'<img', content, re.IGNORECASE))
+        img_count = len(_IMG_RE.findall(content))
         if img_count >= 2:
             score += 10
         else:
             issues.append(f"Only {img_count} images (recommend 2+)")
         
         # Check for internal links
-        link_count = len(re.findall(r'<a\s', content, re.IGNORECASE))
+        link_count = len(_LINK_RE.findall(content))
         if link_count >= 3:
             score += 15
         else:
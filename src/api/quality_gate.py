@@ -9,14 +9,14 @@ Endpoints:
 - GET /api/v1/quality-gate/thresholds - Get current thresholds
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
 
 from src.core.database import get_db
 from src.core.auth import get_current_admin
-from src.services.quality_gate import EnhancedQualityGate
+from src.services.quality_gate import EnhancedQualityGate, TextView, dumps_json
 
 router = APIRouter(prefix="/api/v1/quality-gate", tags=["quality-gate"])
 
@@ -165,10 +165,14 @@ async def detailed_quality_check(
             components=request.components
         )
         
-        return {
-            "status": "success",
-            "diagnostic": diagnostic.to_dict()
-        }
+        # Serialize directly instead of letting FastAPI re-walk the nested dicts
+        return Response(
+            content=dumps_json({
+                "status": "success",
+                "diagnostic": diagnostic.to_dict()
+            }),
+            media_type="application/json"
+        )
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -251,8 +255,9 @@ async def quick_quality_check(
     try:
         service = EnhancedQualityGate()
         
-        text_content = service._strip_html(request.content)
-        word_count = len(text_content.split())
+        # Strip and tokenize once; the word count and SEO check share it
+        view = TextView.from_text(service._strip_html(request.content))
+        word_count = view.word_count
         
         issues = []
         score = 100
@@ -264,7 +269,7 @@ async def quick_quality_check(
         
         # SEO check (if keyword)
         if request.target_keyword:
-            seo_score, seo_issues = service._analyze_seo(request.content, request.target_keyword)
+            seo_score, seo_issues = service._analyze_seo(request.content, request.target_keyword, view)
             issues.extend(seo_issues)
             score = min(score, seo_score)
         
@@ -303,7 +303,7 @@ class ContentIntelligenceService:
             # Conduct research (Task 2 will implement orchestrator)
             logger.info(f"Conducting research for {industry}/{audience}")
             if self.orchestrator:
-                research = await self.orchestrator.conduct_research(context)
+                research = await self.orchestrator.conduct_research(context, force_refresh=force_refresh)
             else:
                 # Fallback to mock research if orchestrator not ready
                 research = await self._generate_mock_research(context)
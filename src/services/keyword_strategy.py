@@ -10,13 +10,29 @@ Features:
 - B2B buyer journey optimization
 """
 
+import asyncio
+import copy
+import heapq
+import itertools
 import logging
-from typing import List, Dict, Any, Set, Optional
+import sys
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Dict, Any, Set, Optional, Iterator, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+try:
+    from src.integrations.keyword_client import KeywordClient
+    KEYWORD_CLIENT_AVAILABLE = True
+except Exception as e:  # ImportError, or settings validation when config is missing
+    logger.debug(f"KeywordClient unavailable, keyword enrichment disabled: {e}")
+    KeywordClient = None
+    KEYWORD_CLIENT_AVAILABLE = False
+
 
 class SearchIntent(str, Enum):
     """Search intent types"""
@@ -46,6 +62,76 @@ class KeywordCandidate:
     # Real data from API (optional, populated when API is available)
     search_volume: Optional[int] = None
     difficulty_score: Optional[int] = None  # 0-100 numeric score
+    # Lowercased words in order, computed once for diversity filtering
+    _tokens: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._tokens = tuple(self.keyword.lower().split())
+
+
+@lru_cache(maxsize=256)
+def _semantic_group(stage: CustomerJourneyStage, category: str) -> str:
+    """Shared (interned) semantic group label for a stage/category pair"""
+    return sys.intern(f"{stage.value}_{category}")
+
+
+def _build_phrase_trie(keywords: List[str]) -> Dict[str, dict]:
+    """
+    Build a token trie over every word-suffix of the given keywords
+
+    Walking the trie from any candidate position yields the longest
+    phrase (run of consecutive words) shared with a selected keyword.
+    """
+    trie: Dict[str, dict] = {}
+    for kw in keywords:
+        words = kw.lower().split()
+        for start in range(len(words)):
+            node = trie
+            for word in words[start:]:
+                node = node.setdefault(word, {})
+    return trie
+
+
+def _longest_shared_phrase(tokens: Tuple[str, ...], trie: Dict[str, dict], stop_at: int) -> int:
+    """Length of the longest token run in ``tokens`` found in ``trie`` (capped at stop_at)"""
+    longest = 0
+    for start in range(len(tokens)):
+        # Remaining tokens can't beat the current best
+        if len(tokens) - start <= longest:
+            break
+        node = trie
+        length = 0
+        for word in tokens[start:]:
+            node = node.get(word)
+            if node is None:
+                break
+            length += 1
+        if length > longest:
+            longest = length
+            if longest >= stop_at:
+                break
+    return longest
+
+
+# Profile fields that make up the pool cache key (the whole WebsiteProfile)
+_PROFILE_KEY_FIELDS = (
+    "product_categories", "industry_terms", "content_themes",
+    "target_audience", "business_type", "sample_keywords"
+)
+
+# Generated pools shared by every generator (instances are short-lived):
+# {(profile key, limit, intent_mix, journey_mix): (pool, expiry as time.monotonic() value)}, LRU order
+_POOL_CACHE_MAX_ENTRIES = 32
+_pool_cache: "OrderedDict[tuple, Tuple[List[KeywordCandidate], float]]" = OrderedDict()
+
+
+def _profile_key(profile) -> tuple:
+    """Hashable snapshot of a (mutable) website profile"""
+    values = []
+    for name in _PROFILE_KEY_FIELDS:
+        value = getattr(profile, name, None)
+        values.append(tuple(value) if isinstance(value, list) else value)
+    return tuple(values)
 
 
 class ContentAwareKeywordGenerator:
@@ -54,6 +140,9 @@ class ContentAwareKeywordGenerator:
     Adapts to business domain automatically
     """
 
+    # Generated pools are reused for this long, then rebuilt (and re-enriched)
+    POOL_CACHE_TTL = 3600  # 1 hour
+
     def __init__(self, website_profile=None):
         """
         Initialize with website profile
@@ -105,33 +194,54 @@ class ContentAwareKeywordGenerator:
                 CustomerJourneyStage.DECISION: 0.3
             }
 
-        keywords = []
-
-        # Generate keywords for each journey stage
-        for stage, stage_ratio in journey_mix.items():
-            stage_limit = int(limit * stage_ratio)
-            stage_keywords = self._generate_stage_keywords(stage, stage_limit, intent_mix)
-            keywords.extend(stage_keywords)
-
-        # Enrich with real search volume data from API
-        keywords = self._enrich_with_api_data(keywords)
-
-        # Sort by search volume (descending) if available
-        keywords.sort(key=lambda k: (k.search_volume or 0), reverse=True)
+        cache_key = (
+            _profile_key(self.website_profile),
+            limit,
+            tuple(intent_mix.items()),
+            tuple(journey_mix.items())
+        )
+        cached = _pool_cache.get(cache_key)
+        if cached is not None:
+            pool, expiry = cached
+            if time.monotonic() < expiry:
+                _pool_cache.move_to_end(cache_key)
+                logger.debug("Returning cached keyword pool")
+                return self._copy_pool(pool)
+            del _pool_cache[cache_key]
+
+        # Generate keywords for each journey stage lazily
+        candidates = itertools.chain.from_iterable(
+            self._generate_stage_keywords(stage, int(limit * stage_ratio), intent_mix)
+            for stage, stage_ratio in journey_mix.items()
+        )
+
+        # Enrich with real search volume data from API (needs the whole pool
+        # for a single batched lookup, so materialize it once here)
+        keywords = self._enrich_with_api_data(list(candidates))
+
+        # Select top keywords by search volume (descending) if available
+        keywords = heapq.nlargest(limit, keywords, key=lambda k: k.search_volume or 0)
 
         logger.info(f"Generated {len(keywords)} content-aware keywords")
-        return keywords[:limit]
+        _pool_cache[cache_key] = (keywords, time.monotonic() + self.POOL_CACHE_TTL)
+        while len(_pool_cache) > _POOL_CACHE_MAX_ENTRIES:
+            _pool_cache.popitem(last=False)
+        return self._copy_pool(keywords)
+
+    @staticmethod
+    def _copy_pool(keywords: List[KeywordCandidate]) -> List[KeywordCandidate]:
+        """Copies of cached candidates, so callers can't change the cached pool"""
+        return [copy.copy(k) for k in keywords]
 
     def _enrich_with_api_data(self, keywords: List[KeywordCandidate]) -> List[KeywordCandidate]:
         """
         Enrich keywords with real search volume and difficulty data from API.
         Falls back to estimates if API is unavailable.
         """
-        try:
-            # Import here to avoid circular dependencies
-            import asyncio
-            from src.integrations.keyword_client import KeywordClient
+        if not KEYWORD_CLIENT_AVAILABLE:
+            return self._apply_fallback_scores(keywords)
 
+        try:
             client = KeywordClient(provider='dataforseo')
 
             # Check if API credentials are configured
@@ -139,34 +249,27 @@ class ContentAwareKeywordGenerator:
                 logger.debug("No API key configured, skipping enrichment")
                 return keywords
 
-            # Get unique keywords to query
-            unique_keywords = list({k.keyword for k in keywords})
+            # Stages only dedupe within themselves; dedupe across them (order-preserving)
+            # so the same keyword is never sent to the API twice
+            unique_keywords = list(dict.fromkeys(k.keyword for k in keywords))
 
             # Query API for first keyword to get suggestions (limit API calls)
             if unique_keywords:
                 # Check if we're already in an event loop
                 try:
-                    loop = asyncio.get_running_loop()
-                    # If we get here, we're in an async context - can't nest loops
-                    logger.debug("Already in event loop, using estimate-based enrichment to avoid loop nesting")
-                    # Skip API call and use estimates
-                    for kw in keywords:
-                        kw.difficulty_score = self._estimate_to_score(kw.difficulty_estimate)
-                    return keywords
+                    asyncio.get_running_loop()
+                    # Blocking on the API here would stall the caller's event loop
+                    logger.debug("Already in event loop, using estimate-based enrichment to avoid blocking it")
+                    return self._apply_fallback_scores(keywords)
                 except RuntimeError:
-                    # No loop running, safe to create one and make API call
+                    # No loop running, safe to run one for the API call
                     pass
-                
-                try:
-                    # Run async call in sync context (only if no loop is running)
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
 
+                try:
                     # Get keyword suggestions for the first seed keyword
-                    opportunities = loop.run_until_complete(
+                    opportunities = asyncio.run(
                         client.get_keyword_suggestions(unique_keywords[0], limit=min(len(unique_keywords), 50))
                     )
-                    loop.close()
 
                     # Create lookup map
                     api_data = {opp.keyword.lower(): opp for opp in opportunities}
@@ -191,25 +294,21 @@ class ContentAwareKeywordGenerator:
 
                 except Exception as e:
                     logger.warning(f"Could not enrich keywords with API data: {e}")
-                    # Fallback: map estimates to scores
-                    for kw in keywords:
-                        kw.difficulty_score = self._estimate_to_score(kw.difficulty_estimate)
+                    self._apply_fallback_scores(keywords)
             else:
                 # No keywords to enrich, just map estimates
-                for kw in keywords:
-                    kw.difficulty_score = self._estimate_to_score(kw.difficulty_estimate)
-
-        except ImportError as e:
-            logger.debug(f"Could not import KeywordClient: {e}")
-            # Fallback: map estimates to scores
-            for kw in keywords:
-                kw.difficulty_score = self._estimate_to_score(kw.difficulty_estimate)
+                self._apply_fallback_scores(keywords)
+
         except Exception as e:
             logger.warning(f"Error enriching keywords: {e}")
-            # Fallback: map estimates to scores
-            for kw in keywords:
-                kw.difficulty_score = self._estimate_to_score(kw.difficulty_estimate)
+            self._apply_fallback_scores(keywords)
+
+        return keywords
 
+    def _apply_fallback_scores(self, keywords: List[KeywordCandidate]) -> List[KeywordCandidate]:
+        """Map difficulty estimates to numeric scores when API data is unavailable"""
+        for kw in keywords:
+            kw.difficulty_score = self._estimate_to_score(kw.difficulty_estimate)
         return keywords
 
     def _estimate_to_score(self, estimate: str) -> int:
@@ -226,8 +325,8 @@ class ContentAwareKeywordGenerator:
         stage: CustomerJourneyStage,
         limit: int,
         intent_mix: Dict[SearchIntent, float]
-    ) -> List[KeywordCandidate]:
-        """Generate keywords for specific customer journey stage"""
+    ) -> Iterator[KeywordCandidate]:
+        """Lazily generate keywords for specific customer journey stage"""
 
         if stage == CustomerJourneyStage.AWARENESS:
             return self._generate_awareness_keywords(limit, intent_mix)
@@ -240,17 +339,19 @@ class ContentAwareKeywordGenerator:
         self,
         limit: int,
         intent_mix: Dict[SearchIntent, float]
-    ) -> List[KeywordCandidate]:
+    ) -> Iterator[KeywordCandidate]:
         """
         Generate awareness stage keywords (problem recognition)
         Customer doesn't know about your product yet
         """
-        keywords = []
+        count = 0
+        seen: Set[str] = set()
         profile = self.website_profile
 
         # Extract product categories from profile
-        categories = profile.product_categories[:5] if profile.product_categories else ["packaging"]
+        categories = [sys.intern(c) for c in profile.product_categories[:5]] if profile.product_categories else ["packaging"]
         themes = profile.content_themes[:3] if profile.content_themes else ["quality"]
+        first_theme = themes[0]
 
         # Awareness templates (problem-focused)
         awareness_templates = [
@@ -265,45 +366,49 @@ class ContentAwareKeywordGenerator:
         ]
 
         for template in awareness_templates:
-            if len(keywords) >= limit:
-                break
+            # Add theme variation once per template
+            base = template.replace("{theme}", first_theme)
 
             for category in categories:
-                if len(keywords) >= limit:
-                    break
+                if count >= limit:
+                    return
+
+                keyword = base.replace("{category}", category)
 
-                keyword = template.replace("{category}", category)
+                # Skip duplicate expansions before building a candidate
+                if keyword in seen:
+                    continue
+                seen.add(keyword)
 
-                # Add theme variation
-                if "{theme}" in template and themes:
-                    keyword = keyword.replace("{theme}", themes[0])
+                is_long_tail = keyword.count(" ") + 1 >= 4
 
-                keywords.append(KeywordCandidate(
+                yield KeywordCandidate(
                     keyword=keyword,
                     intent=SearchIntent.INFORMATIONAL,
                     journey_stage=CustomerJourneyStage.AWARENESS,
                     category=category,
-                    difficulty_estimate="low" if len(keyword.split()) >= 4 else "medium",
-                    is_long_tail=len(keyword.split()) >= 4,
-                    semantic_group=f"awareness_{category}"
-                ))
-
-        return keywords[:limit]
+                    difficulty_estimate="low" if is_long_tail else "medium",
+                    is_long_tail=is_long_tail,
+                    semantic_group=_semantic_group(CustomerJourneyStage.AWARENESS, category)
+                )
+                count += 1
 
     def _generate_consideration_keywords(
         self,
         limit: int,
         intent_mix: Dict[SearchIntent, float]
-    ) -> List[KeywordCandidate]:
+    ) -> Iterator[KeywordCandidate]:
         """
         Generate consideration stage keywords (solution exploration)
         Customer is researching options
         """
-        keywords = []
+        count = 0
+        seen: Set[str] = set()
         profile = self.website_profile
 
-        categories = profile.product_categories[:5] if profile.product_categories else ["packaging"]
+        categories = [sys.intern(c) for c in profile.product_categories[:5]] if profile.product_categories else ["packaging"]
         industry_terms = profile.industry_terms[:5] if profile.industry_terms else ["wholesale"]
+        first_industry_term = industry_terms[0]
 
         # Consideration templates (solution-focused)
         consideration_templates = [
@@ -318,45 +423,49 @@ class ContentAwareKeywordGenerator:
         ]
 
         for template in consideration_templates:
-            if len(keywords) >= limit:
-                break
+            # Add industry term variation once per template
+            base = template.replace("{industry_term}", first_industry_term)
 
             for category in categories:
-                if len(keywords) >= limit:
-                    break
+                if count >= limit:
+                    return
+
+                keyword = base.replace("{category}", category)
 
-                keyword = template.replace("{category}", category)
+                # Skip duplicate expansions before building a candidate
+                if keyword in seen:
+                    continue
+                seen.add(keyword)
 
-                # Add industry term variation
-                if "{industry_term}" in template and industry_terms:
-                    keyword = keyword.replace("{industry_term}", industry_terms[0])
+                is_long_tail = keyword.count(" ") + 1 >= 4
 
-                keywords.append(KeywordCandidate(
+                yield KeywordCandidate(
                     keyword=keyword,
                     intent=SearchIntent.COMMERCIAL,
                     journey_stage=CustomerJourneyStage.CONSIDERATION,
                     category=category,
-                    difficulty_estimate="low" if len(keyword.split()) >= 4 else "medium",
-                    is_long_tail=len(keyword.split()) >= 4,
-                    semantic_group=f"consideration_{category}"
-                ))
-
-        return keywords[:limit]
+                    difficulty_estimate="low" if is_long_tail else "medium",
+                    is_long_tail=is_long_tail,
+                    semantic_group=_semantic_group(CustomerJourneyStage.CONSIDERATION, category)
+                )
+                count += 1
 
     def _generate_decision_keywords(
         self,
         limit: int,
         intent_mix: Dict[SearchIntent, float]
-    ) -> List[KeywordCandidate]:
+    ) -> Iterator[KeywordCandidate]:
         """
         Generate decision stage keywords (product selection)
         Customer is ready to buy/contact supplier
         """
-        keywords = []
+        count = 0
+        seen: Set[str] = set()
         profile = self.website_profile
 
-        categories = profile.product_categories[:5] if profile.product_categories else ["packaging"]
+        categories = [sys.intern(c) for c in profile.product_categories[:5]] if profile.product_categories else ["packaging"]
         industry_terms = profile.industry_terms[:5] if profile.industry_terms else ["wholesale"]
+        first_industry_term = industry_terms[0]
 
         # Decision templates (product-focused)
         decision_templates = [
@@ -371,30 +480,30 @@ class ContentAwareKeywordGenerator:
         ]
 
         for template in decision_templates:
-            if len(keywords) >= limit:
-                break
+            # Add industry term variation once per template
+            base = template.replace("{industry_term}", first_industry_term)
 
             for category in categories:
-                if len(keywords) >= limit:
-                    break
+                if count >= limit:
+                    return
 
-                keyword = template.replace("{category}", category)
+                keyword = base.replace("{category}", category)
 
-                # Add industry term variation
-                if "{industry_term}" in template and industry_terms:
-                    keyword = keyword.replace("{industry_term}", industry_terms[0])
+                # Skip duplicate expansions before building a candidate
+                if keyword in seen:
+                    continue
+                seen.add(keyword)
 
-                keywords.append(KeywordCandidate(
+                yield KeywordCandidate(
                     keyword=keyword,
                     intent=SearchIntent.TRANSACTIONAL,
                     journey_stage=CustomerJourneyStage.DECISION,
                     category=category,
                     difficulty_estimate="medium",
-                    is_long_tail=len(keyword.split()) >= 4,
-                    semantic_group=f"decision_{category}"
-                ))
-
-        return keywords[:limit]
+                    is_long_tail=keyword.count(" ") + 1 >= 4,
+                    semantic_group=_semantic_group(CustomerJourneyStage.DECISION, category)
+                )
+                count += 1
 
     def _generate_default_keywords(self, limit: int) -> List[KeywordCandidate]:
         """Generate default keywords when no profile available"""
@@ -407,14 +516,18 @@ class ContentAwareKeywordGenerator:
         ]
 
         keywords = []
+        seen: Set[str] = set()
         for kw in default_keywords[:limit]:
+            if kw in seen:
+                continue
+            seen.add(kw)
             keywords.append(KeywordCandidate(
                 keyword=kw,
                 intent=SearchIntent.TRANSACTIONAL,
                 journey_stage=CustomerJourneyStage.DECISION,
                 category="general",
                 difficulty_estimate="medium",
-                is_long_tail=len(kw.split()) >= 4,
+                is_long_tail=kw.count(" ") + 1 >= 4,
                 semantic_group="default"
             ))
 
@@ -430,6 +543,9 @@ class ContentAwareKeywordGenerator:
         Filter keywords to ensure semantic diversity
         Prevents selecting too similar keywords on the same day
 
+        Overlap is the longest run of consecutive words a candidate shares
+        with any selected keyword, relative to the candidate's length.
+
         Args:
             candidates: Available keyword candidates
             selected_keywords: Already selected keywords today
@@ -441,19 +557,26 @@ class ContentAwareKeywordGenerator:
         if not selected_keywords:
             return candidates
 
-        # Extract semantic groups from selected keywords
-        selected_groups = set()
-        for kw in selected_keywords:
-            # Simple semantic grouping by main topic words
-            words = set(kw.lower().split())
-            selected_groups.update(words)
+        # Index phrases of selected keywords so shared word order counts
+        selected_trie = _build_phrase_trie(selected_keywords)
 
         diverse_candidates = []
         for candidate in candidates:
-            # Calculate diversity score
-            candidate_words = set(candidate.keyword.lower().split())
-            overlap = len(candidate_words & selected_groups)
-            diversity_score = 1 - (overlap / len(candidate_words)) if candidate_words else 0
+            # Calculate diversity score (tokens are precomputed per candidate)
+            candidate_words = candidate._tokens
+            if not candidate_words:
+                if min_diversity_score <= 0:
+                    diverse_candidates.append(candidate)
+                continue
+
+            # Smallest shared phrase length that fails the threshold
+            word_count = len(candidate_words)
+            reject_at = next(
+                (n for n in range(1, word_count + 1) if 1 - (n / word_count) < min_diversity_score),
+                word_count + 1
+            )
+            overlap = _longest_shared_phrase(candidate_words, selected_trie, reject_at)
+            diversity_score = 1 - (overlap / word_count)
 
             if diversity_score >= min_diversity_score:
                 diverse_candidates.append(candidate)
@@ -10,18 +10,212 @@ Features:
 - Content health scoring with weighted factors
 """
 
+import asyncio
 import logging
 import re
+import threading
 import hashlib
+import json
+import heapq
+import string
+import sys
 from typing import Dict, Any, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
-from collections import Counter
+from collections import Counter, OrderedDict
+from operator import itemgetter
+from functools import lru_cache
 from difflib import SequenceMatcher
 
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+# ==================== Compiled Patterns ====================
+
+# One pass over the HTML counts every tag of interest: headings, paragraphs
+# and lists need a following '>' or whitespace, links need whitespace, and
+# images match on the '<img' prefix alone
+_TAG_CENSUS_RE = re.compile(r'<(?:(h[1-6]|p|[uo]l)[>\s]|(img)|(a)\s)', re.IGNORECASE)
+_LINK_HREF_RE = re.compile(r'<a[^>]+href=["\'][^"\']*["\']')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+# One match per non-blank run of text between sentence terminators
+_SENTENCE_RE = re.compile(r'[^.!?]*[^.!?\s]')
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n\n+')
+_KEYWORD_RE = re.compile(r'\b[a-zA-Z]{4,}\b')
+
+# ASCII punctuation is always a word boundary for _KEYWORD_RE, so mapping it
+# to spaces before split() preserves its tokenization ('_' is a word char)
+_KEYWORD_SPLIT_TABLE = str.maketrans({c: " " for c in string.punctuation if c != "_"})
+
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
+    'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'would', 'could', 'should', 'may', 'might', 'must', 'shall',
+    'can', 'need', 'to', 'of', 'in', 'for', 'on', 'with', 'at',
+    'by', 'from', 'as', 'into', 'through', 'during', 'before',
+    'after', 'above', 'below', 'between', 'under', 'again',
+    'further', 'then', 'once', 'and', 'but', 'or', 'nor', 'so',
+    'yet', 'both', 'each', 'few', 'more', 'most', 'other', 'some',
+    'such', 'no', 'not', 'only', 'own', 'same', 'than', 'too',
+    'very', 'just', 'also', 'now', 'that', 'this', 'these', 'those'
+})
+
+# Factual indicators
+# Sentences with a factual indicator (verb, statistic or source attribution)
+_FACT_RE = re.compile(
+    r'[A-Z][^.!?]*?'
+    r'(?:is|are|was|were|has|have|can|will|should|must'
+    r'|\d+%|\d+ percent|\$\d+|\d+ million|\d+ billion'
+    r'|according to|research shows|studies indicate)'
+    r'[^.!?]*[.!?]',
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=256)
+def _strip_html_cached(html: str) -> str:
+    """
+    Remove HTML tags and collapse whitespace
+
+    str.split()/join normalizes whitespace exactly like the former regex whitespace
+    substitution plus strip(), but in C. Cached because the same documents are stripped
+    repeatedly within and across diagnostics.
+    """
+    if "<" not in html:
+        # Plain text: no tags to remove, skip the regex pass
+        return " ".join(html.split())
+    return " ".join(_HTML_TAG_RE.sub(" ", html).split())
+
+
+def _keyword_tokens(text: str):
+    """
+    Yield words of 4+ ASCII letters, equivalent to _KEYWORD_RE.findall(text)
+
+    Most tokens are plain ASCII words after the translate/split pass; only
+    tokens with digits, '_' or non-ASCII characters go through the regex.
+    """
+    for token in text.translate(_KEYWORD_SPLIT_TABLE).split():
+        if token.isascii() and token.isalpha():
+            if len(token) >= 4:
+                yield token
+        else:
+            yield from _KEYWORD_RE.findall(token)
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _normalized_digest(text: str) -> bytes:
+    """SHA-256 of case- and whitespace-normalized text, for exact-duplicate lookup"""
+    return hashlib.sha256(" ".join(text.lower().split()).encode("utf-8")).digest()
+
+
+def _tag_census(content: str) -> Counter:
+    """Count HTML tags (h1-h6, p, ul, ol, img, a) in a single scan"""
+    return Counter(
+        m.group(m.lastindex).lower() for m in _TAG_CENSUS_RE.finditer(content)
+    )
+
+
+# ==================== MinHash / LSH Prefilter ====================
+
+# MinHash signatures estimate shingle-set Jaccard similarity. Banding the
+# signatures (LSH) gives a cheap candidate prefilter, so only documents that
+# are plausibly similar reach the expensive pairwise comparators.
+MINHASH_NUM_PERM = 128
+# Low candidate threshold (~ (1 / bands) ** (1 / rows) = 0.125) so partial
+# overlaps get the full comparison
+LSH_BANDS = 64
+LSH_ROWS = 2
+# Non-candidate documents that still get the full comparison, chosen by their
+# Jaccard + shingle score, so a diagnostic always reports the closest match
+NON_CANDIDATE_MATCHES = 5
+
+_MINHASH_RNG = np.random.default_rng(20240901)
+_MINHASH_A = _MINHASH_RNG.integers(1, 2 ** 63, size=MINHASH_NUM_PERM, dtype=np.uint64) | np.uint64(1)
+_MINHASH_B = _MINHASH_RNG.integers(0, 2 ** 63, size=MINHASH_NUM_PERM, dtype=np.uint64)
+_UINT64_MASK = 0xFFFFFFFFFFFFFFFF
+
+
+# Polynomial base for rolling shingle hashes (Rabin-Karp style)
+_SHINGLE_HASH_BASE = np.uint64(1_000_000_007)
+
+# Facts are single sentences, so they are shingled by characters, not words
+FACT_SHINGLE_SIZE = 3
+
+
+def _hashed_shingles(words: List[str], size: int) -> np.ndarray:
+    """
+    Hash every run of ``size`` consecutive words into a sorted, unique uint64 array
+
+    Word hashes are combined with a rolling polynomial hash, so no shingle
+    strings are materialized.
+    """
+    if len(words) < size:
+        return np.array([hash(" ".join(words)) & _UINT64_MASK], dtype=np.uint64)
+
+    # hash() is a signed 64-bit value; viewing it as uint64 equals "& _UINT64_MASK"
+    word_hashes = np.fromiter(
+        map(hash, words), dtype=np.int64, count=len(words)
+    ).view(np.uint64)
+    count = len(words) - size + 1
+    shingles = word_hashes[:count].copy()
+    # uint64 arithmetic wraps around (mod 2**64)
+    with np.errstate(over="ignore"):
+        for offset in range(1, size):
+            shingles *= _SHINGLE_HASH_BASE
+            shingles += word_hashes[offset:offset + count]
+    return np.unique(shingles)
+
+
+def _minhash_signature(shingles: np.ndarray) -> np.ndarray:
+    """Compute a MinHash signature (multiply-shift hashing) for hashed shingles"""
+    # uint64 arithmetic wraps around, which is what multiply-shift hashing wants
+    with np.errstate(over="ignore"):
+        permuted = (_MINHASH_A[:, None] * shingles[None, :] + _MINHASH_B[:, None]) >> np.uint64(32)
+    return permuted.min(axis=1)
+
+
+def _fact_signature(fact: str) -> np.ndarray:
+    """MinHash signature over character trigrams of a (short) fact sentence"""
+    return _minhash_signature(_hashed_shingles(list(fact.lower()), FACT_SHINGLE_SIZE))
+
+
+class _MinHashLSH:
+    """Banded LSH index over MinHash signatures"""
+
+    def __init__(self, bands: int = LSH_BANDS, rows: int = LSH_ROWS):
+        self.bands = bands
+        self.rows = rows
+        self._buckets: List[Dict[bytes, List[Any]]] = [{} for _ in range(bands)]
+
+    def _band_keys(self, signature: np.ndarray):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def insert(self, key: Any, signature: np.ndarray) -> None:
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band].setdefault(band_key, []).append(key)
+
+    def query(self, signature: np.ndarray) -> Set[Any]:
+        candidates = set()
+        for band, band_key in self._band_keys(signature):
+            candidates.update(self._buckets[band].get(band_key, ()))
+        return candidates
+
+
 class IssueSeverity(str, Enum):
     """Issue severity levels"""
     CRITICAL = "critical"  # Blocks publication
@@ -42,7 +236,14 @@ class IssueCategory(str, Enum):
     READABILITY = "readability"
 
 
-@dataclass
+# Severity values in declaration order, used to seed per-severity counts
+_SEVERITY_KEYS = tuple(s.value for s in IssueSeverity)
+
+# Sort rank per severity (declaration order is most to least severe)
+_SEVERITY_RANK = {severity: rank for rank, severity in enumerate(IssueSeverity)}
+
+
+@dataclass(slots=True)
 class QualityIssue:
     """Detailed quality issue with fix recommendation"""
     issue_id: str
@@ -73,7 +274,7 @@ class QualityIssue:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SimilarityMatch:
     """Similarity detection result"""
     matched_content_id: str
@@ -94,7 +295,7 @@ class SimilarityMatch:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class InformationAnalysis:
     """Information increment analysis result"""
     unique_facts_count: int
@@ -117,7 +318,7 @@ class InformationAnalysis:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class QualityDiagnostic:
     """Complete quality diagnostic report"""
     content_id: str
@@ -150,12 +351,179 @@ class QualityDiagnostic:
         }
     
     def _count_by_severity(self) -> Dict[str, int]:
-        counts = {s.value: 0 for s in IssueSeverity}
+        counts = dict.fromkeys(_SEVERITY_KEYS, 0)
         for issue in self.issues:
             counts[issue.severity.value] += 1
         return counts
 
 
+@dataclass(slots=True)
+class DocFeatures:
+    """Per-document text features, computed once and reused across comparisons"""
+    text: str                # HTML-stripped text
+    word_set: frozenset
+    shingles: np.ndarray     # Sorted unique hashed w-shingles
+    minhash: np.ndarray      # MinHash signature of the shingles
+
+
+@dataclass(slots=True)
+class TextView:
+    """Stripped text plus the derived forms the analyzers share, computed once"""
+    raw: str
+    words: List[str]
+    word_count: int
+    sentence_count: int      # Non-blank fragments between .!? runs
+    paragraphs: List[str]
+    _lower: Optional[str] = field(default=None, repr=False)
+    
+    @property
+    def lower(self) -> str:
+        """Lowercased text, only built when a keyword check needs it"""
+        if self._lower is None:
+            self._lower = self.raw.lower()
+        return self._lower
+    
+    @classmethod
+    def from_text(cls, text: str) -> "TextView":
+        words = text.split()
+        return cls(
+            raw=text,
+            words=words,
+            word_count=len(words),
+            sentence_count=sum(1 for _ in _SENTENCE_RE.finditer(text)),
+            paragraphs=_PARAGRAPH_SPLIT_RE.split(text)
+        )
+
+
+# Process-wide LRU of existing-document features, keyed by a digest of the raw
+# content (plus shingle size), so a stable corpus is only preprocessed once
+DOC_FEATURES_CACHE_SIZE = 4096
+_doc_features_cache: "OrderedDict[Tuple[bytes, int], DocFeatures]" = OrderedDict()
+_doc_features_lock = threading.Lock()
+
+
+def _set_jaccard(set1: frozenset, set2: frozenset) -> float:
+    """Jaccard similarity of two sets"""
+    if not set1 or not set2:
+        return 0.0
+    intersection = len(set1 & set2)
+    return intersection / (len(set1) + len(set2) - intersection)
+
+
+def _array_jaccard(array1: np.ndarray, array2: np.ndarray) -> float:
+    """Jaccard similarity of two sorted, unique uint64 arrays"""
+    if not array1.size or not array2.size:
+        return 0.0
+    # Both arrays are sorted and unique, so this is a linear merge
+    intersection = np.intersect1d(array1, array2, assume_unique=True).size
+    return intersection / (array1.size + array2.size - intersection)
+
+
+def _batch_array_jaccard(query: np.ndarray, offsets: np.ndarray, flat: np.ndarray) -> np.ndarray:
+    """
+    Jaccard similarity of ``query`` against every document of a CSR-packed corpus
+
+    ``flat`` concatenates each document's sorted unique shingle array and
+    ``offsets`` holds the segment boundaries (len = documents + 1). The whole
+    corpus is scored in a few vectorized passes instead of a Python loop.
+    """
+    sizes = np.diff(offsets)
+    if not flat.size or not query.size:
+        return np.zeros(sizes.size)
+    hits = np.isin(flat, query).astype(np.int64)
+    # Prefix sums give per-segment counts (safe for empty segments)
+    cumulative = np.concatenate(([0], np.cumsum(hits)))
+    intersections = cumulative[offsets[1:]] - cumulative[offsets[:-1]]
+    unions = sizes + query.size - intersections
+    return np.where(unions > 0, intersections / np.maximum(unions, 1), 0.0)
+
+
+# ==================== Structure Rules ====================
+
+# (applies(counts), score penalty, QualityIssue fields). "description" and
+# "current_value" are format templates over the counts passed to applies().
+_STRUCTURE_RULES = [
+    (lambda c: c["h1"] == 0, 15, {
+        "issue_id": "STR-001",
+        "category": IssueCategory.STRUCTURE,
+        "severity": IssueSeverity.HIGH,
+        "title": "Missing H1 Heading",
+        "description": "Content has no H1 heading",
+        "location": "Beginning of content",
+        "current_value": "0 H1 headings",
+        "expected_value": "Exactly 1 H1 heading",
+        "fix_recommendation": "Add a single H1 heading at the top that contains your primary keyword and clearly describes the page content.",
+        "auto_fixable": True,
+        "estimated_fix_time": "2 min",
+    }),
+    (lambda c: c["h1"] > 1, 10, {
+        "issue_id": "STR-002",
+        "category": IssueCategory.STRUCTURE,
+        "severity": IssueSeverity.MEDIUM,
+        "title": "Multiple H1 Headings",
+        "description": "Content has {h1} H1 headings (should have 1)",
+        "location": "Multiple locations",
+        "current_value": "{h1} H1 headings",
+        "expected_value": "1 H1 heading",
+        "fix_recommendation": "Keep only one H1 heading. Convert others to H2 headings.",
+        "auto_fixable": True,
+        "estimated_fix_time": "5 min",
+    }),
+    (lambda c: c["h2"] < 3, 10, {
+        "issue_id": "STR-003",
+        "category": IssueCategory.STRUCTURE,
+        "severity": IssueSeverity.MEDIUM,
+        "title": "Insufficient Section Headings",
+        "description": "Only {h2} H2 headings (recommend 3+)",
+        "location": "Throughout content",
+        "current_value": "{h2} H2 headings",
+        "expected_value": "3+ H2 headings",
+        "fix_recommendation": "Add more H2 section headings to break up content. Each major topic should have its own H2. This improves readability and SEO.",
+        "auto_fixable": False,
+        "estimated_fix_time": "10 min",
+    }),
+    (lambda c: c["p"] < 5, 10, {
+        "issue_id": "STR-004",
+        "category": IssueCategory.STRUCTURE,
+        "severity": IssueSeverity.MEDIUM,
+        "title": "Insufficient Paragraphs",
+        "description": "Only {p} paragraphs found",
+        "location": "Content body",
+        "current_value": "{p} paragraphs",
+        "expected_value": "5+ paragraphs",
+        "fix_recommendation": "Break content into more paragraphs. Aim for 2-4 sentences per paragraph for better readability.",
+        "auto_fixable": False,
+        "estimated_fix_time": "5 min",
+    }),
+    (lambda c: c["lists"] == 0, 5, {
+        "issue_id": "STR-005",
+        "category": IssueCategory.STRUCTURE,
+        "severity": IssueSeverity.LOW,
+        "title": "No Lists Used",
+        "description": "Content has no bulleted or numbered lists",
+        "location": "Content body",
+        "current_value": "0 lists",
+        "expected_value": "1+ lists",
+        "fix_recommendation": "Add bulleted or numbered lists to present key points, steps, or features. Lists improve scannability and can trigger featured snippets.",
+        "auto_fixable": False,
+        "estimated_fix_time": "5 min",
+    }),
+    (lambda c: c["img"] == 0, 10, {
+        "issue_id": "STR-006",
+        "category": IssueCategory.STRUCTURE,
+        "severity": IssueSeverity.MEDIUM,
+        "title": "No Images",
+        "description": "Content has no images",
+        "location": "Throughout content",
+        "current_value": "0 images",
+        "expected_value": "2+ images",
+        "fix_recommendation": "Add relevant images with descriptive alt text. Include at least one hero image and one supporting image (chart, infographic, product photo).",
+        "auto_fixable": False,
+        "estimated_fix_time": "10 min",
+    }),
+]
+
+
 class EnhancedQualityGate:
     """
     Enhanced Quality Gate Service
@@ -174,6 +542,14 @@ class EnhancedQualityGate:
     MIN_WORD_COUNT = 500
     MIN_READING_GRADE = 6  # Flesch-Kincaid grade level
     MAX_READING_GRADE = 14
+    SHINGLE_SIZE = 5  # For w-shingling
+    
+    # Components every piece of content must include
+    REQUIRED_COMPONENTS = frozenset({"summary", "faq"})
+    
+    # Sentence matching prefilter (word trigram Jaccard before SequenceMatcher)
+    SENTENCE_NGRAM_SIZE = 3
+    SENTENCE_PREFILTER_THRESHOLD = 0.4
     
     # Scoring weights
     SCORE_WEIGHTS = {
@@ -195,7 +571,18 @@ class EnhancedQualityGate:
     }
     
     def __init__(self):
-        self.shingle_size = 5  # For w-shingling
+        # Corpus indexes over existing content, reused while the corpus is unchanged
+        self._corpus_key: Optional[Tuple] = None
+        self._lsh_index: Optional[_MinHashLSH] = None
+        self._corpus_offsets: Optional[np.ndarray] = None
+        self._corpus_shingles: Optional[np.ndarray] = None
+        self._exact_hash_index: Dict[bytes, int] = {}
+        self._fact_index_key: Optional[Tuple] = None
+        self._fact_index: Optional[_MinHashLSH] = None
+        self._indexed_facts: List[str] = []
+        self._fact_signatures = np.empty((0, MINHASH_NUM_PERM), dtype=np.uint64)
+        # Analyses run in worker threads; this guards the cached indexes above
+        self._index_lock = threading.RLock()
     
     # ==================== Main Entry Point ====================
     
@@ -222,17 +609,44 @@ class EnhancedQualityGate:
         """
         logger.info(f"Running quality diagnostic for: {content_id}")
         
+        # The analyses are CPU-bound; keep them off the event loop
+        return await asyncio.to_thread(
+            self._run_locked, self._run_all_analyses,
+            content, content_id, existing_content, target_keyword, components
+        )
+    
+    def _run_locked(self, func, *args):
+        """Call func while holding the index lock (worker threads share the gate)"""
+        with self._index_lock:
+            return func(*args)
+    
+    def _run_all_analyses(
+        self,
+        content: str,
+        content_id: str,
+        existing_content: Optional[List[Dict[str, Any]]],
+        target_keyword: Optional[str],
+        components: Optional[List[str]]
+    ) -> QualityDiagnostic:
+        """Run every analysis synchronously and compile the diagnostic"""
         issues = []
         scores = {}
         
         # Clean content for analysis
         text_content = self._strip_html(content)
+        view = TextView.from_text(text_content)
+        
+        # Existing-document features (cached across calls) shared by all analyses
+        existing_features = [
+            self._existing_doc_features(e.get("content", ""))
+            for e in existing_content or []
+        ]
         
         # 1. Similarity Analysis
         similarity_result = None
         if existing_content:
-            similarity_result, similarity_issues = await self._analyze_similarity(
-                content, text_content, existing_content
+            similarity_result, similarity_issues = self._similarity_analysis(
+                content, text_content, existing_content, existing_features
             )
             issues.extend(similarity_issues)
             scores["similarity"] = 100 - (similarity_result.overall_similarity * 100) if similarity_result else 100
@@ -244,31 +658,34 @@ class EnhancedQualityGate:
         if existing_content:
             info_result, info_issues = self._analyze_information_increment(
                 text_content, 
-                [self._strip_html(e.get("content", "")) for e in existing_content]
+                [f.text for f in existing_features]
             )
             issues.extend(info_issues)
             scores["information"] = info_result.information_value_score if info_result else 100
         else:
             scores["information"] = 100
         
+        # Count structural tags once for structure analysis and metrics
+        tag_counts = _tag_census(content)
+        
         # 3. Structure Analysis
-        structure_score, structure_issues = self._analyze_structure(content)
+        structure_score, structure_issues = self._analyze_structure(content, tag_counts)
         issues.extend(structure_issues)
         scores["structure"] = structure_score
         
         # 4. SEO Analysis
-        seo_score, seo_issues = self._analyze_seo(content, target_keyword)
+        seo_score, seo_issues = self._analyze_seo(content, target_keyword, view)
         issues.extend(seo_issues)
         scores["seo"] = seo_score
         
         # 5. Readability Analysis
-        readability_score, readability_issues = self._analyze_readability(text_content)
+        readability_score, readability_issues = self._analyze_readability(view)
         issues.extend(readability_issues)
         scores["readability"] = readability_score
         
         # 6. Completeness Analysis
         completeness_score, completeness_issues = self._analyze_completeness(
-            content, text_content, components or []
+            content, view, components or []
         )
         issues.extend(completeness_issues)
         scores["completeness"] = completeness_score
@@ -282,27 +699,28 @@ class EnhancedQualityGate:
         # Determine grade
         grade = self._calculate_grade(overall_score)
         
-        # Check if can publish
-        critical_issues = [i for i in issues if i.severity == IssueSeverity.CRITICAL]
-        high_issues = [i for i in issues if i.severity == IssueSeverity.HIGH]
+        # Check if can publish (severities counted in one pass)
+        severity_counts = Counter(i.severity for i in issues)
+        critical_count = severity_counts[IssueSeverity.CRITICAL]
+        high_count = severity_counts[IssueSeverity.HIGH]
         
-        can_publish = len(critical_issues) == 0 and overall_score >= 60
-        passed = len(critical_issues) == 0 and len(high_issues) <= 2 and overall_score >= 70
+        can_publish = critical_count == 0 and overall_score >= 60
+        passed = critical_count == 0 and high_count <= 2 and overall_score >= 70
         
         # Generate summary
-        summary = self._generate_summary(overall_score, grade, issues, can_publish)
+        summary = self._generate_summary(overall_score, grade, severity_counts, can_publish)
         
         # Top recommendations
         top_recommendations = self._generate_top_recommendations(issues)
         
         # Compile metrics
         metrics = {
-            "word_count": len(text_content.split()),
-            "character_count": len(text_content),
-            "paragraph_count": len(re.findall(r'<p[>\s]', content, re.IGNORECASE)),
-            "heading_count": len(re.findall(r'<h[1-6][>\s]', content, re.IGNORECASE)),
-            "image_count": len(re.findall(r'<img', content, re.IGNORECASE)),
-            "link_count": len(re.findall(r'<a\s', content, re.IGNORECASE)),
+            "word_count": view.word_count,
+            "character_count": len(view.raw),
+            "paragraph_count": tag_counts["p"],
+            "heading_count": sum(tag_counts[f"h{level}"] for level in range(1, 7)),
+            "image_count": tag_counts["img"],
+            "link_count": tag_counts["a"],
             "component_scores": scores
         }
         
@@ -326,44 +744,130 @@ class EnhancedQualityGate:
         self,
         content: str,
         text_content: str,
-        existing_content: List[Dict[str, Any]]
+        existing_content: List[Dict[str, Any]],
+        existing_features: Optional[List[DocFeatures]] = None
     ) -> Tuple[Optional[SimilarityMatch], List[QualityIssue]]:
         """Analyze content similarity using multiple algorithms"""
+        return await asyncio.to_thread(
+            self._run_locked, self._similarity_analysis,
+            content, text_content, existing_content, existing_features
+        )
+    
+    def _similarity_analysis(
+        self,
+        content: str,
+        text_content: str,
+        existing_content: List[Dict[str, Any]],
+        existing_features: Optional[List[DocFeatures]] = None
+    ) -> Tuple[Optional[SimilarityMatch], List[QualityIssue]]:
+        """Synchronous similarity analysis (see _analyze_similarity)"""
         issues = []
         max_match = None
         max_similarity = 0.0
         
-        for existing in existing_content:
-            existing_text = self._strip_html(existing.get("content", ""))
-            existing_id = existing.get("id", "unknown")
-            existing_url = existing.get("url")
+        if existing_features is None:
+            existing_features = [
+                self._existing_doc_features(e.get("content", ""))
+                for e in existing_content
+            ]
+        self._index_corpus(existing_content, existing_features)
+        
+        exact_idx = self._exact_hash_index.get(_normalized_digest(text_content))
+        if exact_idx is not None:
+            # Exact (normalized) duplicate: every algorithm scores 1.0, so the
+            # per-document comparison can be skipped entirely
+            existing = existing_content[exact_idx]
+            max_match = SimilarityMatch(
+                matched_content_id=existing.get("id", "unknown"),
+                matched_url=existing.get("url"),
+                overall_similarity=1.0,
+                algorithm_scores={"sequence_matcher": 1.0, "jaccard": 1.0, "shingle": 1.0},
+                matching_sections=self._find_matching_sections(
+                    text_content, existing_features[exact_idx].text
+                ),
+                is_duplicate=True
+            )
+        else:
+            query = self._prepare_doc(text_content)
             
-            # Multi-algorithm similarity
-            algo_scores = {
-                "sequence_matcher": self._sequence_matcher_similarity(text_content, existing_text),
-                "jaccard": self._jaccard_similarity(text_content, existing_text),
-                "shingle": self._shingle_similarity(text_content, existing_text)
-            }
+            # Shingle similarity against the whole corpus in one vectorized pass
+            shingle_scores = _batch_array_jaccard(
+                query.shingles, self._corpus_offsets, self._corpus_shingles
+            )
+            jaccard_scores = [
+                _set_jaccard(query.word_set, doc.word_set) for doc in existing_features
+            ]
             
-            # Weighted average (shingle is best for plagiarism detection)
-            overall = (
-                algo_scores["sequence_matcher"] * 0.3 +
-                algo_scores["jaccard"] * 0.2 +
-                algo_scores["shingle"] * 0.5
+            # LSH candidates get the full comparison. Of the other documents only
+            # the one closest by Jaccard and shingle score is run through
+            # SequenceMatcher, so an unrelated corpus still reports its best match
+            candidates = self._lsh_index.query(query.minhash)
+            others = [i for i in range(len(existing_features)) if i not in candidates]
+            if others:
+                candidates.update(heapq.nsmallest(
+                    NON_CANDIDATE_MATCHES, others,
+                    key=lambda i: (-(jaccard_scores[i] * 0.2 + shingle_scores[i] * 0.5), i)
+                ))
+            
+            # Likely matches first (highest shingle score, then closest length)
+            # so the best match is found early and the rest can be pruned
+            text_length = len(text_content)
+            ordered = sorted(
+                candidates,
+                key=lambda i: (
+                    -shingle_scores[i], abs(len(existing_features[i].text) - text_length), i
+                )
             )
+            max_idx = -1
             
-            if overall > max_similarity:
-                max_similarity = overall
-                matching_sections = self._find_matching_sections(text_content, existing_text)
+            for idx in ordered:
+                existing = existing_content[idx]
+                doc = existing_features[idx]
+                existing_text = doc.text
+                existing_id = existing.get("id", "unknown")
+                existing_url = existing.get("url")
+                
+                jaccard = jaccard_scores[idx]
+                shingle = float(shingle_scores[idx])
                 
-                max_match = SimilarityMatch(
-                    matched_content_id=existing_id,
-                    matched_url=existing_url,
-                    overall_similarity=overall,
-                    algorithm_scores=algo_scores,
-                    matching_sections=matching_sections,
-                    is_duplicate=overall >= self.DUPLICATE_THRESHOLD
+                # Skip SequenceMatcher when even a perfect ratio cannot beat the best match
+                if 0.3 + jaccard * 0.2 + shingle * 0.5 < max_similarity:
+                    continue
+            
+                # Multi-algorithm similarity
+                algo_scores = {
+                    "sequence_matcher": self._sequence_matcher_similarity(text_content, existing_text),
+                    "jaccard": jaccard,
+                    "shingle": shingle
+                }
+            
+                # Weighted average (shingle is best for plagiarism detection)
+                overall = (
+                    algo_scores["sequence_matcher"] * 0.3 +
+                    algo_scores["jaccard"] * 0.2 +
+                    algo_scores["shingle"] * 0.5
                 )
+            
+                # Ties go to the earliest document, as in a scan in corpus order
+                if overall > max_similarity or (
+                    max_match is not None and overall == max_similarity and idx < max_idx
+                ):
+                    max_similarity = overall
+                    max_idx = idx
+                    matching_sections = self._find_matching_sections(text_content, existing_text)
+                
+                    max_match = SimilarityMatch(
+                        matched_content_id=existing_id,
+                        matched_url=existing_url,
+                        overall_similarity=overall,
+                        algorithm_scores=algo_scores,
+                        matching_sections=matching_sections,
+                        is_duplicate=overall >= self.DUPLICATE_THRESHOLD
+                    )
+                    
+                    # A near-exact match cannot be meaningfully beaten
+                    if overall >= 0.99:
+                        break
         
         # Generate issues based on similarity
         if max_match and max_match.is_duplicate:
@@ -407,48 +911,94 @@ class EnhancedQualityGate:
         
         return max_match, issues
     
-    def _sequence_matcher_similarity(self, text1: str, text2: str) -> float:
-        """Standard SequenceMatcher similarity"""
-        return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
+    def _prepare_doc(self, text: str) -> DocFeatures:
+        """Compute reusable similarity features for a stripped text"""
+        words = text.lower().split()
+        shingles = _hashed_shingles(words, self.SHINGLE_SIZE)
+        return DocFeatures(
+            text=text,
+            # Interned so indexed documents share one copy of each word and
+            # set intersections hit the identity fast path
+            word_set=frozenset(map(sys.intern, set(words))),
+            shingles=shingles,
+            minhash=_minhash_signature(shingles)
+        )
+    
+    def _existing_doc_features(self, content: str) -> DocFeatures:
+        """Features for an existing document, served from the process-wide cache"""
+        key = (hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest(), self.SHINGLE_SIZE)
+        with _doc_features_lock:
+            features = _doc_features_cache.get(key)
+            if features is not None:
+                _doc_features_cache.move_to_end(key)
+                return features
+        
+        features = self._prepare_doc(self._strip_html(content))
+        with _doc_features_lock:
+            _doc_features_cache[key] = features
+            if len(_doc_features_cache) > DOC_FEATURES_CACHE_SIZE:
+                _doc_features_cache.popitem(last=False)
+        return features
     
-    def _jaccard_similarity(self, text1: str, text2: str) -> float:
-        """Jaccard similarity based on word sets"""
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
+    def _index_corpus(
+        self,
+        existing_content: List[Dict[str, Any]],
+        existing_features: List[DocFeatures]
+    ) -> None:
+        """Build the LSH index and packed shingle arrays unless the corpus is unchanged"""
+        corpus_key = tuple(
+            (e.get("id"), hash(e.get("content", ""))) for e in existing_content
+        )
+        if corpus_key == self._corpus_key:
+            return
+        
+        index = _MinHashLSH()
+        exact_hash_index: Dict[bytes, int] = {}
+        for idx, features in enumerate(existing_features):
+            index.insert(idx, features.minhash)
+            # Keep the first document for each digest (matches scan order)
+            exact_hash_index.setdefault(_normalized_digest(features.text), idx)
+        
+        sizes = [features.shingles.size for features in existing_features]
+        self._corpus_offsets = np.concatenate(([0], np.cumsum(sizes))).astype(np.int64)
+        self._corpus_shingles = (
+            np.concatenate([features.shingles for features in existing_features])
+            if existing_features else np.empty(0, dtype=np.uint64)
+        )
+        self._lsh_index = index
+        self._exact_hash_index = exact_hash_index
+        self._corpus_key = corpus_key
+    
+    def _sequence_matcher_similarity(
+        self,
+        text1: str,
+        text2: str,
+        threshold: Optional[float] = None
+    ) -> float:
+        """
+        Standard SequenceMatcher similarity
         
-        if not words1 or not words2:
+        With a threshold, returns 0.0 without running the full ratio() when
+        the cheap upper bounds already rule out reaching it.
+        """
+        matcher = SequenceMatcher(None, text1.lower(), text2.lower())
+        if threshold is not None and (
+            matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold
+        ):
             return 0.0
-        
-        intersection = words1 & words2
-        union = words1 | words2
-        
-        return len(intersection) / len(union)
+        return matcher.ratio()
+    
+    def _jaccard_similarity(self, text1: str, text2: str) -> float:
+        """Jaccard similarity based on word sets"""
+        return _set_jaccard(frozenset(text1.lower().split()), frozenset(text2.lower().split()))
     
     def _shingle_similarity(self, text1: str, text2: str) -> float:
         """W-shingling similarity (better for plagiarism detection)"""
-        shingles1 = self._get_shingles(text1)
-        shingles2 = self._get_shingles(text2)
-        
-        if not shingles1 or not shingles2:
-            return 0.0
-        
-        intersection = shingles1 & shingles2
-        union = shingles1 | shingles2
-        
-        return len(intersection) / len(union)
+        return _array_jaccard(self._get_shingles(text1), self._get_shingles(text2))
     
-    def _get_shingles(self, text: str) -> Set[str]:
-        """Generate w-shingles from text"""
-        words = text.lower().split()
-        if len(words) < self.shingle_size:
-            return {" ".join(words)}
-        
-        shingles = set()
-        for i in range(len(words) - self.shingle_size + 1):
-            shingle = " ".join(words[i:i + self.shingle_size])
-            shingles.add(shingle)
-        
-        return shingles
+    def _get_shingles(self, text: str) -> np.ndarray:
+        """Generate hashed w-shingles from text (sorted unique uint64 array)"""
+        return _hashed_shingles(text.lower().split(), self.SHINGLE_SIZE)
     
     def _find_matching_sections(self, text1: str, text2: str) -> List[Dict[str, Any]]:
         """Find specific matching sections between texts"""
@@ -458,9 +1008,17 @@ class EnhancedQualityGate:
         sentences1 = [s.strip() for s in text1.split('.') if len(s.strip()) > 30]
         sentences2 = [s.strip() for s in text2.split('.') if len(s.strip()) > 30]
         
+        # Rolling-hash word n-grams per sentence, computed once
+        ngram_size = self.SENTENCE_NGRAM_SIZE
+        ngrams2 = [_hashed_shingles(s2.lower().split(), ngram_size) for s2 in sentences2]
+        
         for i, s1 in enumerate(sentences1[:20]):  # Limit to first 20 sentences
-            for s2 in sentences2:
-                sim = SequenceMatcher(None, s1.lower(), s2.lower()).ratio()
+            ngrams1 = _hashed_shingles(s1.lower().split(), ngram_size)
+            for s2, s2_ngrams in zip(sentences2, ngrams2):
+                # Cheap n-gram overlap check before the character-level match
+                if _array_jaccard(ngrams1, s2_ngrams) < self.SENTENCE_PREFILTER_THRESHOLD:
+                    continue
+                sim = self._sequence_matcher_similarity(s1, s2, threshold=0.8)
                 if sim > 0.8:  # High match
                     matches.append({
                         "source_position": i,
@@ -485,10 +1043,8 @@ class EnhancedQualityGate:
         # Extract facts/statements (sentences with factual indicators)
         content_facts = self._extract_facts(content)
         
-        # Build corpus of existing facts
-        existing_facts = set()
-        for existing in existing_contents:
-            existing_facts.update(self._extract_facts(existing))
+        # Index the corpus of existing facts
+        self._index_facts(existing_contents)
         
         # Find unique facts
         unique_facts = []
@@ -498,11 +1054,17 @@ class EnhancedQualityGate:
             is_unique = True
             fact_lower = fact.lower()
             
-            for existing_fact in existing_facts:
-                sim = SequenceMatcher(None, fact_lower, existing_fact.lower()).ratio()
-                if sim > 0.7:  # Similar fact
-                    is_unique = False
-                    break
+            # Only LSH candidates are verified, most similar signature first
+            signature = _fact_signature(fact)
+            candidates = list(self._fact_index.query(signature))
+            if candidates:
+                agreement = (self._fact_signatures[candidates] == signature).sum(axis=1)
+                for pos in np.argsort(-agreement, kind="stable"):
+                    existing_fact = self._indexed_facts[candidates[pos]]
+                    sim = self._sequence_matcher_similarity(fact_lower, existing_fact, threshold=0.7)
+                    if sim > 0.7:  # Similar fact
+                        is_unique = False
+                        break
             
             if is_unique:
                 unique_facts.append(fact)
@@ -558,162 +1120,80 @@ class EnhancedQualityGate:
         
         return analysis, issues
     
+    def _index_facts(self, existing_contents: List[str]) -> None:
+        """Build the MinHash-LSH index over existing facts unless the texts are unchanged"""
+        fact_index_key = tuple(hash(existing) for existing in existing_contents)
+        if fact_index_key == self._fact_index_key:
+            return
+        
+        existing_facts = set()
+        for existing in existing_contents:
+            existing_facts.update(self._extract_facts(existing))
+        
+        facts = list(existing_facts)
+        index = _MinHashLSH()
+        signatures = np.empty((len(facts), MINHASH_NUM_PERM), dtype=np.uint64)
+        for idx, fact in enumerate(facts):
+            signatures[idx] = _fact_signature(fact)
+            index.insert(idx, signatures[idx])
+        
+        self._fact_index = index
+        self._indexed_facts = facts
+        self._fact_signatures = signatures
+        self._fact_index_key = fact_index_key
+    
     def _extract_facts(self, text: str) -> List[str]:
         """Extract factual statements from text"""
-        # Factual indicators
-        fact_patterns = [
-            r'[A-Z][^.!?]*(?:is|are|was|were|has|have|can|will|should|must)[^.!?]*[.!?]',
-            r'[A-Z][^.!?]*(?:\d+%|\d+ percent|\$\d+|\d+ million|\d+ billion)[^.!?]*[.!?]',
-            r'[A-Z][^.!?]*(?:according to|research shows|studies indicate)[^.!?]*[.!?]',
-        ]
-        
-        facts = []
-        for pattern in fact_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            facts.extend(matches)
+        facts = {m.group(0) for m in _FACT_RE.finditer(text)}
         
         # Also include simple sentences
         sentences = [s.strip() for s in text.split('.') if 20 < len(s.strip()) < 200]
-        facts.extend(sentences[:30])  # Limit
+        facts.update(sentences[:30])  # Limit
         
-        return list(set(facts))
+        return list(facts)
     
     def _extract_keywords(self, texts: List[str]) -> List[str]:
         """Extract important keywords from text list"""
-        words = []
-        stop_words = {'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 
-                      'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-                      'would', 'could', 'should', 'may', 'might', 'must', 'shall',
-                      'can', 'need', 'to', 'of', 'in', 'for', 'on', 'with', 'at',
-                      'by', 'from', 'as', 'into', 'through', 'during', 'before',
-                      'after', 'above', 'below', 'between', 'under', 'again',
-                      'further', 'then', 'once', 'and', 'but', 'or', 'nor', 'so',
-                      'yet', 'both', 'each', 'few', 'more', 'most', 'other', 'some',
-                      'such', 'no', 'not', 'only', 'own', 'same', 'than', 'too',
-                      'very', 'just', 'also', 'now', 'that', 'this', 'these', 'those'}
-        
+        counter = Counter()
         for text in texts:
-            text_words = re.findall(r'\b[a-zA-Z]{4,}\b', text.lower())
-            words.extend([w for w in text_words if w not in stop_words])
+            counter.update(
+                word for word in _keyword_tokens(text.lower())
+                if word not in _STOP_WORDS
+            )
         
-        # Get most common
-        counter = Counter(words)
-        return [word for word, _ in counter.most_common(10)]
+        # Get most common (top-10 heap select, no full vocabulary sort)
+        return [word for word, _ in heapq.nlargest(10, counter.items(), key=itemgetter(1))]
     
     # ==================== Structure Analysis ====================
     
-    def _analyze_structure(self, content: str) -> Tuple[float, List[QualityIssue]]:
+    def _analyze_structure(
+        self,
+        content: str,
+        tag_counts: Optional[Counter] = None
+    ) -> Tuple[float, List[QualityIssue]]:
         """Analyze content structure"""
         issues = []
         score = 100
         
         # Count structural elements
-        h1_count = len(re.findall(r'<h1[>\s]', content, re.IGNORECASE))
-        h2_count = len(re.findall(r'<h2[>\s]', content, re.IGNORECASE))
-        h3_count = len(re.findall(r'<h3[>\s]', content, re.IGNORECASE))
-        p_count = len(re.findall(r'<p[>\s]', content, re.IGNORECASE))
-        list_count = len(re.findall(r'<[uo]l[>\s]', content, re.IGNORECASE))
-        img_count = len(re.findall(r'<img', content, re.IGNORECASE))
-        
-        # H1 check
-        if h1_count == 0:
-            score -= 15
-            issues.append(QualityIssue(
-                issue_id="STR-001",
-                category=IssueCategory.STRUCTURE,
-                severity=IssueSeverity.HIGH,
-                title="Missing H1 Heading",
-                description="Content has no H1 heading",
-                location="Beginning of content",
-                current_value="0 H1 headings",
-                expected_value="Exactly 1 H1 heading",
-                fix_recommendation="Add a single H1 heading at the top that contains your primary keyword and clearly describes the page content.",
-                auto_fixable=True,
-                estimated_fix_time="2 min"
-            ))
-        elif h1_count > 1:
-            score -= 10
-            issues.append(QualityIssue(
-                issue_id="STR-002",
-                category=IssueCategory.STRUCTURE,
-                severity=IssueSeverity.MEDIUM,
-                title="Multiple H1 Headings",
-                description=f"Content has {h1_count} H1 headings (should have 1)",
-                location="Multiple locations",
-                current_value=f"{h1_count} H1 headings",
-                expected_value="1 H1 heading",
-                fix_recommendation="Keep only one H1 heading. Convert others to H2 headings.",
-                auto_fixable=True,
-                estimated_fix_time="5 min"
-            ))
-        
-        # H2 check
-        if h2_count < 3:
-            score -= 10
-            issues.append(QualityIssue(
-                issue_id="STR-003",
-                category=IssueCategory.STRUCTURE,
-                severity=IssueSeverity.MEDIUM,
-                title="Insufficient Section Headings",
-                description=f"Only {h2_count} H2 headings (recommend 3+)",
-                location="Throughout content",
-                current_value=f"{h2_count} H2 headings",
-                expected_value="3+ H2 headings",
-                fix_recommendation="Add more H2 section headings to break up content. Each major topic should have its own H2. This improves readability and SEO.",
-                auto_fixable=False,
-                estimated_fix_time="10 min"
-            ))
-        
-        # Paragraph check
-        if p_count < 5:
-            score -= 10
-            issues.append(QualityIssue(
-                issue_id="STR-004",
-                category=IssueCategory.STRUCTURE,
-                severity=IssueSeverity.MEDIUM,
-                title="Insufficient Paragraphs",
-                description=f"Only {p_count} paragraphs found",
-                location="Content body",
-                current_value=f"{p_count} paragraphs",
-                expected_value="5+ paragraphs",
-                fix_recommendation="Break content into more paragraphs. Aim for 2-4 sentences per paragraph for better readability.",
-                auto_fixable=False,
-                estimated_fix_time="5 min"
-            ))
+        if tag_counts is None:
+            tag_counts = _tag_census(content)
+        counts = {
+            "h1": tag_counts["h1"],
+            "h2": tag_counts["h2"],
+            "p": tag_counts["p"],
+            "lists": tag_counts["ul"] + tag_counts["ol"],
+            "img": tag_counts["img"],
+        }
         
-        # List check
-        if list_count == 0:
-            score -= 5
-            issues.append(QualityIssue(
-                issue_id="STR-005",
-                category=IssueCategory.STRUCTURE,
-                severity=IssueSeverity.LOW,
-                title="No Lists Used",
-                description="Content has no bulleted or numbered lists",
-                location="Content body",
-                current_value="0 lists",
-                expected_value="1+ lists",
-                fix_recommendation="Add bulleted or numbered lists to present key points, steps, or features. Lists improve scannability and can trigger featured snippets.",
-                auto_fixable=False,
-                estimated_fix_time="5 min"
-            ))
-        
-        # Image check
-        if img_count == 0:
-            score -= 10
-            issues.append(QualityIssue(
-                issue_id="STR-006",
-                category=IssueCategory.STRUCTURE,
-                severity=IssueSeverity.MEDIUM,
-                title="No Images",
-                description="Content has no images",
-                location="Throughout content",
-                current_value="0 images",
-                expected_value="2+ images",
-                fix_recommendation="Add relevant images with descriptive alt text. Include at least one hero image and one supporting image (chart, infographic, product photo).",
-                auto_fixable=False,
-                estimated_fix_time="10 min"
-            ))
+        for applies, penalty, template in _STRUCTURE_RULES:
+            if applies(counts):
+                score -= penalty
+                issues.append(QualityIssue(**{
+                    **template,
+                    "description": template["description"].format_map(counts),
+                    "current_value": template["current_value"].format_map(counts),
+                }))
         
         return max(0, score), issues
     
@@ -722,13 +1202,15 @@ class EnhancedQualityGate:
     def _analyze_seo(
         self, 
         content: str, 
-        target_keyword: Optional[str]
+        target_keyword: Optional[str],
+        view: Optional[TextView] = None
     ) -> Tuple[float, List[QualityIssue]]:
         """Analyze SEO elements"""
         issues = []
         score = 100
         
-        text_content = self._strip_html(content)
+        if view is None:
+            view = TextView.from_text(self._strip_html(content))
         
         # Schema markup check
         has_schema = 'application/ld+json' in content or 'itemtype=' in content
@@ -754,11 +1236,10 @@ class EnhancedQualityGate:
         # Keyword optimization
         if target_keyword:
             keyword_lower = target_keyword.lower()
-            content_lower = text_content.lower()
             
             # Keyword in content
-            keyword_count = content_lower.count(keyword_lower)
-            word_count = len(text_content.split())
+            keyword_count = view.lower.count(keyword_lower)
+            word_count = view.word_count
             keyword_density = (keyword_count / word_count * 100) if word_count > 0 else 0
             
             if keyword_count == 0:
@@ -800,7 +1281,7 @@ class EnhancedQualityGate:
                 ))
         
         # Internal links check
-        internal_links = len(re.findall(r'<a[^>]+href=["\'][^"\']*["\']', content))
+        internal_links = len(_LINK_HREF_RE.findall(content))
         if internal_links < 3:
             score -= 10
             issues.append(QualityIssue(
@@ -826,18 +1307,14 @@ class EnhancedQualityGate:
     
     # ==================== Readability Analysis ====================
     
-    def _analyze_readability(self, text: str) -> Tuple[float, List[QualityIssue]]:
+    def _analyze_readability(self, view: TextView) -> Tuple[float, List[QualityIssue]]:
         """Analyze content readability"""
         issues = []
         score = 100
         
         # Calculate readability metrics
-        words = text.split()
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s for s in sentences if len(s.strip()) > 0]
-        
-        word_count = len(words)
-        sentence_count = len(sentences)
+        word_count = view.word_count
+        sentence_count = view.sentence_count
         
         if sentence_count == 0:
             return 50, [QualityIssue(
@@ -878,19 +1355,19 @@ class EnhancedQualityGate:
             ))
         
         # Paragraph length (rough check)
-        paragraphs = re.split(r'\n\n+', text)
-        long_paragraphs = [p for p in paragraphs if len(p.split()) > 100]
+        # Stripped text is whitespace-normalized, so words = spaces + 1
+        long_paragraph_count = sum(1 for p in view.paragraphs if p.count(" ") >= 100)
         
-        if len(long_paragraphs) > 2:
+        if long_paragraph_count > 2:
             score -= 10
             issues.append(QualityIssue(
                 issue_id="READ-003",
                 category=IssueCategory.READABILITY,
                 severity=IssueSeverity.LOW,
                 title="Long Paragraphs",
-                description=f"{len(long_paragraphs)} paragraphs exceed 100 words",
+                description=f"{long_paragraph_count} paragraphs exceed 100 words",
                 location="Multiple paragraphs",
-                current_value=f"{len(long_paragraphs)} long paragraphs",
+                current_value=f"{long_paragraph_count} long paragraphs",
                 expected_value="Paragraphs of 50-75 words",
                 fix_recommendation=(
                     "Break long paragraphs into 2-3 shorter ones. "
@@ -908,7 +1385,7 @@ class EnhancedQualityGate:
     def _analyze_completeness(
         self,
         content: str,
-        text_content: str,
+        view: TextView,
         components: List[str]
     ) -> Tuple[float, List[QualityIssue]]:
         """Analyze content completeness"""
@@ -916,7 +1393,7 @@ class EnhancedQualityGate:
         score = 100
         
         # Word count check
-        word_count = len(text_content.split())
+        word_count = view.word_count
         if word_count < self.MIN_WORD_COUNT:
             score -= 25
             issues.append(QualityIssue(
@@ -940,10 +1417,7 @@ class EnhancedQualityGate:
             ))
         
         # Component check
-        component_set = set(c.lower() for c in components)
-        required = {"summary", "faq"}
-        
-        missing_required = required - component_set
+        missing_required = self.REQUIRED_COMPONENTS.difference(map(str.lower, components))
         if missing_required:
             score -= 15
             issues.append(QualityIssue(
@@ -954,7 +1428,7 @@ class EnhancedQualityGate:
                 description=f"Missing: {', '.join(missing_required)}",
                 location="Content sections",
                 current_value=f"Components: {', '.join(components) or 'none'}",
-                expected_value=f"Must include: {', '.join(required)}",
+                expected_value=f"Must include: {', '.join(self.REQUIRED_COMPONENTS)}",
                 fix_recommendation=(
                     f"Add missing components: "
                     + ("Include a summary/introduction section at the top. " if "summary" in missing_required else "")
@@ -970,9 +1444,7 @@ class EnhancedQualityGate:
     
     def _strip_html(self, html: str) -> str:
         """Remove HTML tags and normalize whitespace"""
-        text = re.sub(r'<[^>]+>', ' ', html)
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        return _strip_html_cached(html)
     
     def _calculate_grade(self, score: float) -> str:
         """Calculate letter grade from score"""
@@ -985,12 +1457,12 @@ class EnhancedQualityGate:
         self,
         score: float,
         grade: str,
-        issues: List[QualityIssue],
+        severity_counts: Counter,
         can_publish: bool
     ) -> str:
         """Generate human-readable summary"""
-        critical = len([i for i in issues if i.severity == IssueSeverity.CRITICAL])
-        high = len([i for i in issues if i.severity == IssueSeverity.HIGH])
+        critical = severity_counts[IssueSeverity.CRITICAL]
+        high = severity_counts[IssueSeverity.HIGH]
         
         if score >= 90:
             return f"Excellent quality (Grade {grade}). Content is ready to publish."
@@ -1007,19 +1479,11 @@ class EnhancedQualityGate:
     
     def _generate_top_recommendations(self, issues: List[QualityIssue]) -> List[str]:
         """Generate top 5 actionable recommendations"""
-        # Sort by severity
-        severity_order = {
-            IssueSeverity.CRITICAL: 0,
-            IssueSeverity.HIGH: 1,
-            IssueSeverity.MEDIUM: 2,
-            IssueSeverity.LOW: 3,
-            IssueSeverity.INFO: 4
-        }
-        
-        sorted_issues = sorted(issues, key=lambda x: severity_order[x.severity])
+        # Most severe first; stable like sorted(...)[:5], without sorting every issue
+        top_issues = heapq.nsmallest(5, issues, key=lambda x: _SEVERITY_RANK[x.severity])
         
         recommendations = []
-        for issue in sorted_issues[:5]:
+        for issue in top_issues:
             prefix = "🔴" if issue.severity == IssueSeverity.CRITICAL else (
                 "🟡" if issue.severity == IssueSeverity.HIGH else "🟢"
             )
@@ -2,13 +2,23 @@
 Research Services Module
 
 Modules for content research and analysis.
+
+Only the cache is imported eagerly; the research services are imported on
+first attribute access (PEP 562), so importing the cache alone does not
+pull in the analyzers and their clients.
 """
 
+import importlib
+
 from .cache import ResearchCache
-from .orchestrator import ResearchOrchestrator
-from .trend_research import TrendResearchService
-from .pain_point_analyzer import PainPointAnalyzer
-from .competitive_analyzer import CompetitiveAnalyzer
+
+# Lazily imported attribute -> submodule
+_LAZY_IMPORTS = {
+    'ResearchOrchestrator': '.orchestrator',
+    'TrendResearchService': '.trend_research',
+    'PainPointAnalyzer': '.pain_point_analyzer',
+    'CompetitiveAnalyzer': '.competitive_analyzer',
+}
 
 __all__ = [
     'ResearchCache',
@@ -17,3 +27,16 @@ __all__ = [
     'PainPointAnalyzer',
     'CompetitiveAnalyzer',
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -7,14 +7,58 @@ Three-tier caching system for research results.
 import logging
 import json
 import hashlib
-from typing import Any, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, bindparam, func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Prefix identifying the context_hash algorithm, so older (unprefixed MD5)
+# rows can be told apart
+CONTEXT_HASH_PREFIX = "sha1:"
+
+
+# Dialects whose insert() supports ON CONFLICT DO UPDATE (single-statement upsert)
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def _context_hash(serialized_data: bytes) -> str:
+    """Change-detection hash of serialized cache data (not a security hash)"""
+    return CONTEXT_HASH_PREFIX + hashlib.sha1(serialized_data).hexdigest()
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize cache data to JSON bytes (unsupported types fall back to str())"""
+    if ORJSON_AVAILABLE:
+        # Keep json.dumps(default=str) behaviour for datetimes, dataclasses and non-str keys
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+    return json.dumps(data, default=str).encode()
+
+
+def _loads(serialized_data) -> Any:
+    """Deserialize JSON cache data from str or bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(serialized_data)
+    return json.loads(serialized_data)
+
 
 class ResearchCache:
     """
@@ -25,9 +69,13 @@ class ResearchCache:
     L3: Database (7 day TTL)
     """
     
+    # Expired L3 rows are deleted (and committed) this many at a time
+    CLEANUP_BATCH_SIZE = 1000
+    
     def __init__(self, db: Optional[Session] = None, redis_client=None):
-        self.memory_cache = {}  # {key: (data, expiry)}
+        self.memory_cache = OrderedDict()  # {key: (data, expiry as time.monotonic() value)}, LRU order
         self.memory_ttl = 3600  # 1 hour
+        self.memory_max_entries = 10000
         self.redis_ttl = 86400  # 24 hours
         self.db_ttl = 604800    # 7 days
         self._db = db
@@ -37,7 +85,8 @@ class ResearchCache:
             'redis_hits': 0,
             'db_hits': 0,
             'misses': 0,
-            'api_calls_saved': 0
+            'api_calls_saved': 0,
+            'total_requests': 0  # Every get() lookup, hit or miss
         }
         logger.info("ResearchCache initialized")
     
@@ -45,12 +94,22 @@ class ResearchCache:
         """Get database session"""
         return self._db
     
+    def _memory_set(self, key: str, data: Any, ttl: float) -> None:
+        """Store in L1, evicting least recently used entries beyond the size cap"""
+        self.memory_cache[key] = (data, time.monotonic() + ttl)
+        self.memory_cache.move_to_end(key)
+        while len(self.memory_cache) > self.memory_max_entries:
+            self.memory_cache.popitem(last=False)
+    
     async def get(self, key: str) -> Optional[Any]:
         """Get data from cache with L1 -> L2 -> L3 fallback"""
+        self.stats['total_requests'] += 1
+        
         # L1: Memory cache
         if key in self.memory_cache:
             data, expiry = self.memory_cache[key]
-            if datetime.now() < expiry:
+            if time.monotonic() < expiry:
+                self.memory_cache.move_to_end(key)
                 self.stats['memory_hits'] += 1
                 self.stats['api_calls_saved'] += 1
                 logger.debug(f"L1 cache hit for {key}")
@@ -64,10 +123,9 @@ class ResearchCache:
             try:
                 redis_data = await self._redis.get(key)
                 if redis_data:
-                    data = json.loads(redis_data)
+                    data = _loads(redis_data)
                     # Promote to L1
-                    expiry = datetime.now() + timedelta(seconds=self.memory_ttl)
-                    self.memory_cache[key] = (data, expiry)
+                    self._memory_set(key, data, self.memory_ttl)
                     self.stats['redis_hits'] += 1
                     self.stats['api_calls_saved'] += 1
                     logger.debug(f"L2 cache hit for {key}")
@@ -80,18 +138,18 @@ class ResearchCache:
         if db:
             try:
                 from src.models.content_intelligence import ResearchCacheEntry
+                now = datetime.now()
                 db_entry = db.query(ResearchCacheEntry).filter(
                     and_(
                         ResearchCacheEntry.cache_key == key,
-                        ResearchCacheEntry.expires_at > datetime.now()
+                        ResearchCacheEntry.expires_at > now
                     )
                 ).first()
                 
                 if db_entry:
-                    data = json.loads(db_entry.data)
+                    data = _loads(db_entry.data)
                     # Promote to L1
-                    expiry = datetime.now() + timedelta(seconds=self.memory_ttl)
-                    self.memory_cache[key] = (data, expiry)
+                    self._memory_set(key, data, self.memory_ttl)
                     # Promote to L2 if Redis available
                     if self._redis:
                         try:
@@ -99,9 +157,7 @@ class ResearchCache:
                         except Exception as e:
                             logger.error(f"Redis promote error: {e}")
                     # Update access stats
-                    db_entry.access_count += 1
-                    db_entry.last_accessed_at = datetime.now()
-                    db.commit()
+                    self._record_access(db, [key], now)
                     
                     self.stats['db_hits'] += 1
                     self.stats['api_calls_saved'] += 1
@@ -116,12 +172,14 @@ class ResearchCache:
     async def set(self, key: str, data: Any, ttl: int = 86400) -> bool:
         """Set data in all cache levels"""
         try:
-            # Serialize data
-            serialized_data = json.dumps(data, default=str)
+            # L1: Memory (stores the object itself, no serialization needed)
+            self._memory_set(key, data, min(ttl, self.memory_ttl))
             
-            # L1: Memory
-            expiry = datetime.now() + timedelta(seconds=min(ttl, self.memory_ttl))
-            self.memory_cache[key] = (data, expiry)
+            # Serialize only when a lower tier will store it
+            db = self._get_db()
+            if not self._redis and not db:
+                return True
+            serialized_data = _dumps(data)
             
             # L2: Redis
             if self._redis:
@@ -131,31 +189,9 @@ class ResearchCache:
                     logger.error(f"Redis set error: {e}")
             
             # L3: Database
-            db = self._get_db()
             if db:
                 try:
-                    from src.models.content_intelligence import ResearchCacheEntry
-                    
-                    # Check if entry exists
-                    existing = db.query(ResearchCacheEntry).filter_by(cache_key=key).first()
-                    
-                    expires_at = datetime.now() + timedelta(seconds=min(ttl, self.db_ttl))
-                    context_hash = hashlib.md5(serialized_data.encode()).hexdigest()
-                    
-                    if existing:
-                        existing.data = serialized_data
-                        existing.expires_at = expires_at
-                        existing.context_hash = context_hash
-                    else:
-                        entry = ResearchCacheEntry(
-                            cache_key=key,
-                            data=serialized_data,
-                            context_hash=context_hash,
-                            expires_at=expires_at,
-                            access_count=0
-                        )
-                        db.add(entry)
-                    
+                    self._db_store(db, key, serialized_data, ttl)
                     db.commit()
                 except Exception as e:
                     logger.error(f"Database set error: {e}")
@@ -166,6 +202,193 @@ class ResearchCache:
             logger.error(f"Error setting cache: {e}")
             return False
     
+    def _db_store(self, db: Session, key: str, serialized_data: bytes, ttl: int) -> None:
+        """Insert or update one L3 entry (caller commits)"""
+        from src.models.content_intelligence import ResearchCacheEntry
+        
+        now = datetime.now()
+        expires_at = now + timedelta(seconds=min(ttl, self.db_ttl))
+        context_hash = _context_hash(serialized_data)
+        
+        # The data column is TEXT
+        serialized_text = serialized_data.decode()
+        
+        insert = _UPSERT_INSERTS.get(getattr(db.get_bind().dialect, "name", None))
+        if insert is not None:
+            # One INSERT ... ON CONFLICT (cache_key) DO UPDATE round trip
+            stmt = insert(ResearchCacheEntry).values(
+                cache_key=key,
+                data=serialized_text,
+                context_hash=context_hash,
+                expires_at=expires_at,
+                access_count=0,
+                created_at=now,
+                updated_at=now
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["cache_key"],
+                set_={
+                    "data": stmt.excluded.data,
+                    "context_hash": stmt.excluded.context_hash,
+                    "expires_at": stmt.excluded.expires_at,
+                    "updated_at": stmt.excluded.updated_at,
+                }
+            )
+            db.execute(stmt)
+            return
+        
+        # Other dialects: check if entry exists
+        existing = db.query(ResearchCacheEntry).filter_by(cache_key=key).first()
+        
+        if existing:
+            existing.data = serialized_text
+            existing.expires_at = expires_at
+            existing.context_hash = context_hash
+        else:
+            entry = ResearchCacheEntry(
+                cache_key=key,
+                data=serialized_text,
+                context_hash=context_hash,
+                expires_at=expires_at,
+                access_count=0
+            )
+            db.add(entry)
+    
+    async def mget(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get several keys at once, returning {key: data} for the hits
+        
+        L1 is checked per key; the remaining keys cost one Redis MGET and
+        one database query instead of a round trip per key.
+        """
+        self.stats['total_requests'] += len(keys)
+        found = {}
+        missing = []
+        now = time.monotonic()
+        for key in keys:
+            cached = self.memory_cache.get(key)
+            if cached is not None and now < cached[1]:
+                self.memory_cache.move_to_end(key)
+                found[key] = cached[0]
+                self.stats['memory_hits'] += 1
+            else:
+                if cached is not None:
+                    del self.memory_cache[key]
+                missing.append(key)
+        
+        # L2: Redis
+        if missing and self._redis:
+            try:
+                values = await self._redis.mget(missing)
+                still_missing = []
+                for key, redis_data in zip(missing, values):
+                    if redis_data:
+                        data = _loads(redis_data)
+                        self._memory_set(key, data, self.memory_ttl)
+                        found[key] = data
+                        self.stats['redis_hits'] += 1
+                    else:
+                        still_missing.append(key)
+                missing = still_missing
+            except Exception as e:
+                logger.error(f"Redis mget error: {e}")
+        
+        # L3: Database
+        db = self._get_db()
+        if missing and db:
+            try:
+                from src.models.content_intelligence import ResearchCacheEntry
+                now_dt = datetime.now()
+                db_entries = db.query(ResearchCacheEntry).filter(
+                    and_(
+                        ResearchCacheEntry.cache_key.in_(missing),
+                        ResearchCacheEntry.expires_at > now_dt
+                    )
+                ).all()
+                
+                promote = {}
+                for db_entry in db_entries:
+                    key = db_entry.cache_key
+                    data = _loads(db_entry.data)
+                    self._memory_set(key, data, self.memory_ttl)
+                    found[key] = data
+                    promote[key] = db_entry.data
+                    self.stats['db_hits'] += 1
+                
+                if promote and self._redis:
+                    try:
+                        pipe = self._redis.pipeline(transaction=False)
+                        for key, serialized in promote.items():
+                            pipe.set(key, serialized, ex=self.redis_ttl)
+                        await pipe.execute()
+                    except Exception as e:
+                        logger.error(f"Redis promote error: {e}")
+                
+                # One executemany UPDATE for all L3 hits of this call
+                if db_entries:
+                    self._record_access(db, [entry.cache_key for entry in db_entries], now_dt)
+            except Exception as e:
+                logger.error(f"Database mget error: {e}")
+        
+        self.stats['api_calls_saved'] += len(found)
+        self.stats['misses'] += len(keys) - len(found)
+        return found
+    
+    async def mset(self, items: Dict[str, Any], ttl: int = 86400) -> bool:
+        """Set several keys at once: one Redis pipeline and one database commit"""
+        try:
+            for key, data in items.items():
+                self._memory_set(key, data, min(ttl, self.memory_ttl))
+            
+            db = self._get_db()
+            if not items or (not self._redis and not db):
+                return True
+            serialized = {key: _dumps(data) for key, data in items.items()}
+            
+            # L2: Redis
+            if self._redis:
+                try:
+                    pipe = self._redis.pipeline(transaction=False)
+                    for key, serialized_data in serialized.items():
+                        pipe.set(key, serialized_data, ex=min(ttl, self.redis_ttl))
+                    await pipe.execute()
+                except Exception as e:
+                    logger.error(f"Redis mset error: {e}")
+            
+            # L3: Database
+            if db:
+                try:
+                    for key, serialized_data in serialized.items():
+                        self._db_store(db, key, serialized_data, ttl)
+                    db.commit()
+                except Exception as e:
+                    logger.error(f"Database mset error: {e}")
+                    db.rollback()
+            
+            return True
+        except Exception as e:
+            logger.error(f"Error setting cache: {e}")
+            return False
+    
+    def _record_access(self, db: Session, keys: List[str], accessed_at: datetime) -> None:
+        """Count one L3 hit per key with a single (executemany) UPDATE and commit it"""
+        from src.models.content_intelligence import ResearchCacheEntry
+        table = ResearchCacheEntry.__table__
+        stmt = (
+            update(table)
+            .where(table.c.cache_key == bindparam("entry_key"))
+            .values(
+                access_count=func.coalesce(table.c.access_count, 0) + 1,
+                last_accessed_at=accessed_at
+            )
+        )
+        try:
+            db.execute(stmt, [{"entry_key": key} for key in keys])
+            db.commit()
+        except Exception as e:
+            logger.error(f"Error recording cache access stats: {e}")
+            db.rollback()
+    
     async def delete(self, key: str) -> bool:
         """Delete data from all cache levels"""
         try:
@@ -198,8 +421,8 @@ class ResearchCache:
     
     def get_stats(self) -> dict:
         """Get cache statistics"""
-        total_hits = self.stats['memory_hits'] + self.stats['redis_hits'] + self.stats['db_hits']
-        total_requests = total_hits + self.stats['misses']
+        total_requests = self.stats['total_requests']
+        total_hits = total_requests - self.stats['misses']
         
         hit_rate = total_hits / total_requests if total_requests > 0 else 0
         
@@ -216,24 +439,18 @@ class ResearchCache:
     
     async def get_memory_hit_rate(self) -> float:
         """Get L1 memory cache hit rate"""
-        total = self.stats['memory_hits'] + self.stats['redis_hits'] + self.stats['db_hits'] + self.stats['misses']
-        if total == 0:
-            return 0.0
-        return self.stats['memory_hits'] / total
+        total = self.stats['total_requests']
+        return self.stats['memory_hits'] / total if total else 0.0
     
     async def get_redis_hit_rate(self) -> float:
         """Get L2 Redis cache hit rate"""
-        total = self.stats['memory_hits'] + self.stats['redis_hits'] + self.stats['db_hits'] + self.stats['misses']
-        if total == 0:
-            return 0.0
-        return self.stats['redis_hits'] / total
+        total = self.stats['total_requests']
+        return self.stats['redis_hits'] / total if total else 0.0
     
     async def get_db_hit_rate(self) -> float:
         """Get L3 database cache hit rate"""
-        total = self.stats['memory_hits'] + self.stats['redis_hits'] + self.stats['db_hits'] + self.stats['misses']
-        if total == 0:
-            return 0.0
-        return self.stats['db_hits'] / total
+        total = self.stats['total_requests']
+        return self.stats['db_hits'] / total if total else 0.0
     
     async def get_api_calls_saved(self) -> int:
         """Get number of API calls saved by caching"""
@@ -256,7 +473,7 @@ class ResearchCache:
         cleaned = 0
         
         # L1: Memory
-        now = datetime.now()
+        now = time.monotonic()
         expired_keys = [
             key for key, (_, expiry) in self.memory_cache.items()
             if now > expiry
@@ -271,10 +488,20 @@ class ResearchCache:
         if db:
             try:
                 from src.models.content_intelligence import ResearchCacheEntry
-                result = db.query(ResearchCacheEntry).filter(
+                # Delete in bounded batches so a large backlog never holds
+                # locks on every expired row in one statement
+                expired_batch = select(ResearchCacheEntry.id).where(
                     ResearchCacheEntry.expires_at < datetime.now()
-                ).delete()
-                db.commit()
+                ).limit(self.CLEANUP_BATCH_SIZE)
+                result = 0
+                while True:
+                    deleted = db.query(ResearchCacheEntry).filter(
+                        ResearchCacheEntry.id.in_(expired_batch)
+                    ).delete(synchronize_session=False)
+                    db.commit()
+                    result += deleted
+                    if deleted < self.CLEANUP_BATCH_SIZE:
+                        break
                 cleaned += result
                 logger.info(f"Cleaned {result} expired entries from database cache")
             except Exception as e:
@@ -4,13 +4,68 @@ Competitive Analyzer
 Analyze competitor content and identify gaps.
 """
 
+import heapq
 import logging
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
 from typing import List
 
 from src.models.content_intelligence import CompetitorInsight, ContentGap, ResearchContext
 
 logger = logging.getLogger(__name__)
 
+# Common content gaps by industry: (topic, gap_type, opportunity_score)
+_INDUSTRY_GAPS = MappingProxyType({
+    "packaging": (
+        ("Detailed cost breakdown by packaging type", "depth", 0.92),
+        ("Small batch packaging solutions", "audience", 0.88),
+        ("Packaging sustainability ROI data", "data", 0.90),
+        ("Startup packaging decision guide", "audience", 0.85)
+    ),
+    "manufacturing": (
+        ("Equipment TCO analysis", "data", 0.90),
+        ("Small manufacturer automation guide", "audience", 0.87),
+        ("Quality control system comparison", "depth", 0.85),
+        ("Regulatory compliance costs", "data", 0.88)
+    ),
+    "logistics": (
+        ("Route optimization ROI calculator", "tool", 0.92),
+        ("Last mile delivery cost analysis", "data", 0.90),
+        ("Fleet management TCO guide", "depth", 0.87),
+        ("Small carrier operations guide", "audience", 0.85)
+    ),
+    "retail": (
+        ("Inventory optimization formulas", "data", 0.90),
+        ("Omnichannel implementation costs", "depth", 0.88),
+        ("Retail KPI benchmarks by segment", "data", 0.85),
+        ("Pop-up store operations guide", "audience", 0.82)
+    ),
+    "technology": (
+        ("Integration cost reality check", "data", 0.92),
+        ("Legacy system migration guide", "depth", 0.90),
+        ("Security ROI calculation", "data", 0.88),
+        ("SMB tech stack recommendations", "audience", 0.85)
+    )
+})
+
+# Suggested content approach by gap type
+_APPROACH_TEMPLATES = {
+    "depth": "Comprehensive deep-dive with actionable frameworks for {topic}",
+    "data": "Original research with industry benchmarks and statistics for {topic}",
+    "audience": "Audience-specific guide addressing unique challenges in {topic}",
+    "angle": "Contrarian or unique perspective on {topic}",
+    "tool": "Interactive tool or calculator for {topic}",
+    "format": "Alternative format (video, infographic) for {topic}"
+}
+
+
+@lru_cache(maxsize=128)
+def _suggested_approach(gap_type: str, topic: str) -> str:
+    """Suggested content approach for a gap, formatted once per (gap_type, topic)"""
+    template = _APPROACH_TEMPLATES.get(gap_type, "Comprehensive coverage of {topic}")
+    return template.format(topic=topic)
+
 
 class CompetitiveAnalyzer:
     """
@@ -27,37 +82,16 @@ class CompetitiveAnalyzer:
         self.max_api_calls = 30
         
         # Common content gaps by industry
-        self.industry_gaps = {
-            "packaging": [
-                ("Detailed cost breakdown by packaging type", "depth", 0.92),
-                ("Small batch packaging solutions", "audience", 0.88),
-                ("Packaging sustainability ROI data", "data", 0.90),
-                ("Startup packaging decision guide", "audience", 0.85)
-            ],
-            "manufacturing": [
-                ("Equipment TCO analysis", "data", 0.90),
-                ("Small manufacturer automation guide", "audience", 0.87),
-                ("Quality control system comparison", "depth", 0.85),
-                ("Regulatory compliance costs", "data", 0.88)
-            ],
-            "logistics": [
-                ("Route optimization ROI calculator", "tool", 0.92),
-                ("Last mile delivery cost analysis", "data", 0.90),
-                ("Fleet management TCO guide", "depth", 0.87),
-                ("Small carrier operations guide", "audience", 0.85)
-            ],
-            "retail": [
-                ("Inventory optimization formulas", "data", 0.90),
-                ("Omnichannel implementation costs", "depth", 0.88),
-                ("Retail KPI benchmarks by segment", "data", 0.85),
-                ("Pop-up store operations guide", "audience", 0.82)
-            ],
-            "technology": [
-                ("Integration cost reality check", "data", 0.92),
-                ("Legacy system migration guide", "depth", 0.90),
-                ("Security ROI calculation", "data", 0.88),
-                ("SMB tech stack recommendations", "audience", 0.85)
+        self.industry_gaps = _INDUSTRY_GAPS
+        
+        # Top gap rows per industry with the suggested approach precomputed:
+        # {industry: [(topic, gap_type, score, suggested_approach)]}
+        self._gap_templates = {
+            key: [
+                (topic, gap_type, score, self._get_suggested_approach(gap_type, topic))
+                for topic, gap_type, score in gap_list[:4]
             ]
+            for key, gap_list in self.industry_gaps.items()
         }
         
         logger.info("CompetitiveAnalyzer initialized")
@@ -90,15 +124,14 @@ class CompetitiveAnalyzer:
             gaps = self._identify_industry_gaps(context)
             
             # Add audience-specific gaps
-            if "small" in context.audience.lower() or "sme" in context.audience.lower():
+            audience_lower = context.audience.lower()
+            if "small" in audience_lower or "sme" in audience_lower:
                 gaps.extend(self._identify_smb_gaps(context))
             
-            # Sort by opportunity score
-            gaps.sort(key=lambda x: x.opportunity_score, reverse=True)
-            
             logger.info(f"Identified {len(gaps)} content gaps for {context.industry}")
             
-            return gaps[:5]  # Top 5 gaps
+            # Top 5 gaps by opportunity score (ties keep their original order)
+            return heapq.nlargest(5, gaps, key=attrgetter("opportunity_score"))
             
         except Exception as e:
             logger.error(f"Gap analysis error: {e}")
@@ -173,18 +206,23 @@ class CompetitiveAnalyzer:
         
         industry_lower = context.industry.lower()
         
-        # Get industry-specific gaps
-        for key, gap_list in self.industry_gaps.items():
-            if key in industry_lower or industry_lower in key or key == "technology":
-                for topic, gap_type, score in gap_list[:4]:
-                    gaps.append(ContentGap(
-                        topic=f"{context.industry}: {topic}",
-                        current_coverage="Generic or enterprise-focused content",
-                        gap_type=gap_type,
-                        opportunity_score=score,
-                        suggested_approach=self._get_suggested_approach(gap_type, topic)
-                    ))
-                break
+        # Get industry-specific gaps (exact match first, then partial match)
+        templates = self._gap_templates.get(industry_lower)
+        if templates is None:
+            for key, candidate in self._gap_templates.items():
+                if key in industry_lower or industry_lower in key or key == "technology":
+                    templates = candidate
+                    break
+        
+        industry_prefix = context.industry + ": "
+        for topic, gap_type, score, approach in templates or []:
+            gaps.append(ContentGap(
+                topic=industry_prefix + topic,
+                current_coverage="Generic or enterprise-focused content",
+                gap_type=gap_type,
+                opportunity_score=score,
+                suggested_approach=approach
+            ))
         
         # Add generic gaps if no specific industry match
         if not gaps:
@@ -228,15 +266,7 @@ class CompetitiveAnalyzer:
     
     def _get_suggested_approach(self, gap_type: str, topic: str) -> str:
         """Get suggested content approach based on gap type"""
-        approaches = {
-            "depth": f"Comprehensive deep-dive with actionable frameworks for {topic}",
-            "data": f"Original research with industry benchmarks and statistics for {topic}",
-            "audience": f"Audience-specific guide addressing unique challenges in {topic}",
-            "angle": f"Contrarian or unique perspective on {topic}",
-            "tool": f"Interactive tool or calculator for {topic}",
-            "format": f"Alternative format (video, infographic) for {topic}"
-        }
-        return approaches.get(gap_type, f"Comprehensive coverage of {topic}")
+        return _suggested_approach(gap_type, topic)
     
     def _get_fallback_competitors(self) -> List[CompetitorInsight]:
         """Fallback competitors when analysis fails"""
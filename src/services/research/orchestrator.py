@@ -7,10 +7,14 @@ Controls API call limits and caching.
 
 import logging
 import asyncio
-from typing import Optional, List
-from datetime import datetime
+import time
+from collections import OrderedDict
+from typing import Optional, List, Tuple
+from datetime import datetime, timedelta
 from dataclasses import dataclass
 
+from sqlalchemy.orm import Session
+
 from src.models.content_intelligence import (
     ResearchContext, ResearchResult, ResearchSource,
     PainPoint, TrendData, CompetitorInsight, ContentGap
@@ -22,7 +26,7 @@ from src.services.research.competitive_analyzer import CompetitiveAnalyzer
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchConfig:
     """Configuration for research orchestration"""
     enable_trends: bool = True
@@ -30,6 +34,8 @@ class ResearchConfig:
     enable_competitive: bool = True
     max_concurrent_calls: int = 3
     timeout_seconds: int = 30
+    result_cache_ttl_seconds: int = 3600
+    result_cache_max_entries: int = 256
 
 
 class ResearchOrchestrator:
@@ -43,7 +49,7 @@ class ResearchOrchestrator:
     - Graceful degradation
     """
     
-    def __init__(self, config: Optional[ResearchConfig] = None):
+    def __init__(self, config: Optional[ResearchConfig] = None, db: Optional[Session] = None):
         self.config = config or ResearchConfig()
         
         # Daily API call limits
@@ -57,63 +63,90 @@ class ResearchOrchestrator:
         # Track API calls
         self.call_counts = {k: 0 for k in self.daily_call_limits.keys()}
         self.call_reset_time = datetime.now().replace(hour=0, minute=0, second=0)
+        self._schedule_next_reset()
+        
+        # Completed results by context, so repeated research skips the analyzers
+        # and does not spend API call budget: {key: (result, monotonic expiry)}
+        self._result_cache: "OrderedDict[Tuple, Tuple[ResearchResult, float]]" = OrderedDict()
+        
+        # Shared by all conduct_research calls, so concurrent or batched research
+        # never has more than max_concurrent_calls service calls in flight
+        self._call_semaphore = asyncio.Semaphore(self.config.max_concurrent_calls)
         
         # Initialize research services
-        self.trend_service = TrendResearchService()
+        self.trend_service = TrendResearchService(db=db)
         self.pain_point_analyzer = PainPointAnalyzer()
         self.competitive_analyzer = CompetitiveAnalyzer()
         
         logger.info("ResearchOrchestrator initialized")
     
-    async def conduct_research(self, context: ResearchContext) -> ResearchResult:
+    async def conduct_research(
+        self,
+        context: ResearchContext,
+        force_refresh: bool = False
+    ) -> ResearchResult:
         """
         Conduct comprehensive research for given context.
         
-        Parallel execution with API limit enforcement.
+        Parallel execution with API limit enforcement. Complete results are
+        cached per context (the cached object is shared between callers);
+        force_refresh bypasses the cached result.
         """
-        # Reset call count if it's a new day
-        now = datetime.now()
-        if now.date() != self.call_reset_time.date():
+        cache_key = self._result_cache_key(context)
+        if not force_refresh:
+            cached = self._get_cached_result(cache_key)
+            if cached is not None:
+                logger.info(f"Research cache hit for {context.industry}/{context.audience}")
+                return cached
+        
+        # Reset call count if it's a new day (a monotonic deadline avoids
+        # building datetimes on every call)
+        if time.monotonic() >= self._next_reset_monotonic:
             self._reset_call_counts()
-            self.call_reset_time = now
+            self.call_reset_time = datetime.now()
+            self._schedule_next_reset()
         
         logger.info(f"Starting research for {context.industry}/{context.audience}")
         logger.info(f"API call budget: {self._get_remaining_calls()}")
         
-        # Build research tasks based on config
+        # Build research tasks based on config; skipped or failed branches
+        # keep their default output
+        outputs = {
+            'trends': None,
+            'pain_points': [],
+            'competitive': ([], []),
+        }
         tasks = []
         task_names = []
+        limit_reached = False
         
         # Task 1: Trend Research
-        if self.config.enable_trends and self._check_call_limit('trends'):
+        if self.config.enable_trends and self._try_acquire_call('trends'):
             tasks.append(self._research_trends_safe(context))
             task_names.append('trends')
         else:
             logger.debug("Skipping trend research (disabled or limit reached)")
-            tasks.append(self._empty_trend_result())
-            task_names.append('trends_empty')
+            limit_reached = limit_reached or self.config.enable_trends
         
         # Task 2: Pain Point Analysis
-        if self.config.enable_pain_points and self._check_call_limit('pain_points'):
+        if self.config.enable_pain_points and self._try_acquire_call('pain_points'):
             tasks.append(self._analyze_pain_points_safe(context))
             task_names.append('pain_points')
         else:
             logger.debug("Skipping pain point analysis (disabled or limit reached)")
-            tasks.append(self._empty_pain_points_result())
-            task_names.append('pain_points_empty')
+            limit_reached = limit_reached or self.config.enable_pain_points
         
         # Task 3: Competitive Analysis
-        if self.config.enable_competitive and self._check_call_limit('competitive'):
+        if self.config.enable_competitive and self._try_acquire_call('competitive'):
             tasks.append(self._analyze_competitive_safe(context))
             task_names.append('competitive')
         else:
             logger.debug("Skipping competitive analysis (disabled or limit reached)")
-            tasks.append(self._empty_competitive_result())
-            task_names.append('competitive_empty')
+            limit_reached = limit_reached or self.config.enable_competitive
         
         # Execute all tasks in parallel with timeout
         try:
-            logger.info(f"Executing {len([t for t in tasks if not asyncio.iscoroutine(t)])} research tasks in parallel")
+            logger.info(f"Executing {len(tasks)} research tasks in parallel")
             
             # Run with timeout
             results = await asyncio.wait_for(
@@ -121,21 +154,23 @@ class ResearchOrchestrator:
                 timeout=self.config.timeout_seconds
             )
             
-            # Process results
-            trend_data = results[0] if not isinstance(results[0], Exception) else None
-            pain_points = results[1] if not isinstance(results[1], Exception) else []
-            competitive_result = results[2] if not isinstance(results[2], Exception) else ([], [])
-            
-            # Handle exceptions
-            for i, result in enumerate(results):
+            # Process results, logging failures. The safe wrappers and the
+            # trend service report failures and limits as empty outputs, so an
+            # empty branch counts as degraded too
+            degraded = False
+            for name, result in zip(task_names, results):
                 if isinstance(result, Exception):
-                    logger.error(f"Research task '{task_names[i]}' failed: {result}")
+                    degraded = True
+                    logger.error(f"Research task '{name}' failed: {result}")
+                else:
+                    outputs[name] = result
+                    if self._is_empty_output(result):
+                        degraded = True
+                        logger.warning(f"Research task '{name}' returned no data")
             
-            # Unpack competitive result
-            if competitive_result and not isinstance(competitive_result, Exception):
-                competitor_insights, content_gaps = competitive_result
-            else:
-                competitor_insights, content_gaps = [], []
+            trend_data = outputs['trends']
+            pain_points = outputs['pain_points']
+            competitor_insights, content_gaps = outputs['competitive']
             
             # Compile final result
             research_result = ResearchResult(
@@ -151,6 +186,10 @@ class ResearchOrchestrator:
                        f"{len(content_gaps or [])} gaps, "
                        f"trend_data={'yes' if trend_data else 'no'}")
             
+            # Only cache complete results; partial ones are retried next call
+            if not limit_reached and not degraded:
+                self._store_cached_result(cache_key, research_result)
+            
             return research_result
             
         except asyncio.TimeoutError:
@@ -160,43 +199,102 @@ class ResearchOrchestrator:
             logger.error(f"Research orchestration failed: {e}", exc_info=True)
             return self._create_fallback_result(context)
     
+    async def conduct_research_batch(
+        self,
+        contexts: List[ResearchContext],
+        force_refresh: bool = False
+    ) -> List[ResearchResult]:
+        """
+        Conduct research for several contexts concurrently.
+        
+        Contexts with the same cache key are researched once. Results are
+        returned in input order. Service calls across the batch are capped
+        by max_concurrent_calls, and each context's timeout_seconds includes
+        time spent waiting for a slot.
+        """
+        unique = {}
+        for context in contexts:
+            unique.setdefault(self._result_cache_key(context), context)
+        
+        results = await asyncio.gather(
+            *(self.conduct_research(context, force_refresh) for context in unique.values())
+        )
+        by_key = dict(zip(unique, results))
+        return [by_key[self._result_cache_key(context)] for context in contexts]
+    
+    def _result_cache_key(self, context: ResearchContext) -> Tuple:
+        """Cache key for a context (case is kept: results embed the industry name)"""
+        return (
+            context.industry,
+            context.audience,
+            tuple(sorted(context.product_categories)),
+        )
+    
+    def _get_cached_result(self, key: Tuple) -> Optional[ResearchResult]:
+        """Return an unexpired cached result, refreshing its LRU position"""
+        cached = self._result_cache.get(key)
+        if cached is None:
+            return None
+        result, expiry = cached
+        if time.monotonic() >= expiry:
+            del self._result_cache[key]
+            return None
+        self._result_cache.move_to_end(key)
+        return result
+    
+    def _store_cached_result(self, key: Tuple, result: ResearchResult) -> None:
+        """Cache a result, evicting least recently used entries past the limit"""
+        self._result_cache[key] = (result, time.monotonic() + self.config.result_cache_ttl_seconds)
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > self.config.result_cache_max_entries:
+            self._result_cache.popitem(last=False)
+    
+    @staticmethod
+    def _is_empty_output(output) -> bool:
+        """True for a branch output with no data (None, [] or ([], []))"""
+        if isinstance(output, tuple):
+            return not any(output)
+        return not output
+    
     async def _research_trends_safe(self, context: ResearchContext) -> Optional[TrendData]:
-        """Safely research trends with error handling"""
+        """Safely research trends with error handling (the call is already counted)"""
         try:
-            if self._check_call_limit('trends'):
-                self._increment_call_count('trends')
-                result = await self.trend_service.research_trends(context)
-                return result
-            return None
+            async with self._call_semaphore:
+                return await self.trend_service.research_trends(context)
         except Exception as e:
             logger.warning(f"Trend research failed: {e}")
             return None
     
     async def _analyze_pain_points_safe(self, context: ResearchContext) -> List[PainPoint]:
-        """Safely analyze pain points with error handling"""
+        """Safely analyze pain points with error handling (the call is already counted)"""
         try:
-            if self._check_call_limit('pain_points'):
-                self._increment_call_count('pain_points')
-                result = await self.pain_point_analyzer.analyze_pain_points(context)
-                return result
-            return []
+            async with self._call_semaphore:
+                return await self.pain_point_analyzer.analyze_pain_points(context)
         except Exception as e:
             logger.warning(f"Pain point analysis failed: {e}")
             return []
     
     async def _analyze_competitive_safe(self, context: ResearchContext) -> tuple[List[CompetitorInsight], List[ContentGap]]:
-        """Safely analyze competition with error handling"""
+        """Safely analyze competition with error handling (the call is already counted)"""
         try:
-            if self._check_call_limit('competitive'):
-                self._increment_call_count('competitive')
-                insights = await self.competitive_analyzer.analyze_competitors(context)
-                gaps = await self.competitive_analyzer.identify_content_gaps(context)
-                return insights, gaps
-            return [], []
+            # Independent analyses; run them concurrently
+            async with self._call_semaphore:
+                insights, gaps = await asyncio.gather(
+                    self.competitive_analyzer.analyze_competitors(context),
+                    self.competitive_analyzer.identify_content_gaps(context)
+                )
+            return insights, gaps
         except Exception as e:
             logger.warning(f"Competitive analysis failed: {e}")
             return [], []
     
+    def _try_acquire_call(self, api_name: str) -> bool:
+        """Count one API call if the limit allows it (check and increment together)"""
+        if not self._check_call_limit(api_name):
+            return False
+        self._increment_call_count(api_name)
+        return True
+    
     def _check_call_limit(self, api_name: str) -> bool:
         """Check if we're within API call limits for specific API"""
         limit = self.daily_call_limits.get(api_name, 100)
@@ -209,6 +307,12 @@ class ResearchOrchestrator:
             self.call_counts[api_name] += 1
             logger.debug(f"API call: {api_name} ({self.call_counts[api_name]}/{self.daily_call_limits[api_name]})")
     
+    def _schedule_next_reset(self):
+        """Set the monotonic deadline for the next daily reset (local midnight)"""
+        now = datetime.now()
+        next_midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        self._next_reset_monotonic = time.monotonic() + (next_midnight - now).total_seconds()
+    
     def _reset_call_counts(self):
         """Reset all call counters (new day)"""
         for key in self.call_counts:
@@ -226,8 +330,10 @@ class ResearchOrchestrator:
         """Compile research sources from all results"""
         sources = []
         
-        if trend_data and hasattr(trend_data, 'sources'):
-            sources.extend(trend_data.sources or [])
+        # TrendData has no sources field today; pick them up if one is added
+        trend_sources = getattr(trend_data, 'sources', None)
+        if trend_sources:
+            sources.extend(trend_sources)
         
         # Add generic sources based on research type
         if pain_points:
@@ -246,15 +352,6 @@ class ResearchOrchestrator:
         
         return sources
     
-    async def _empty_trend_result(self) -> None:
-        return None
-    
-    async def _empty_pain_points_result(self) -> List[PainPoint]:
-        return []
-    
-    async def _empty_competitive_result(self) -> tuple[List[CompetitorInsight], List[ContentGap]]:
-        return [], []
-    
     def _create_partial_result(self) -> ResearchResult:
         """Create partial result when timeout occurs"""
         return ResearchResult(
@@ -6,13 +6,86 @@ Integrates with Google Trends and industry reports.
 """
 
 import logging
-from typing import Optional, List
-from datetime import datetime
+import re
+import time
+import zlib
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
 
-from src.models.content_intelligence import TrendData, ResearchContext, ResearchSource
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from src.models.content_intelligence import APICallLog, TrendData, ResearchContext, ResearchSource
 
 logger = logging.getLogger(__name__)
 
+# Trend direction rules in priority order: (keyword pattern, direction,
+# base growth rate, growth span, span sign). Keywords match as whole words.
+_DIRECTION_RULES = (
+    (re.compile(r'\b(?:sustainable|smart|automation|ai|digital|innovation)\b'), "rising", 15.0, 20, 1),  # 15-35%
+    (re.compile(r'\b(?:traditional|manual|legacy)\b'), "declining", -5.0, 10, -1),  # -5 to -15%
+)
+_DEFAULT_DIRECTION = ("stable", 2.0, 8, 1)  # 2-10%
+
+# Industry-specific trend topics
+_INDUSTRY_TRENDS = MappingProxyType({
+    "packaging": ("sustainable packaging", "smart packaging", "ecommerce packaging"),
+    "manufacturing": ("industry 4.0", "automation", "lean manufacturing"),
+    "logistics": ("supply chain optimization", "last mile delivery", "route optimization"),
+    "retail": ("omnichannel", "personalization", "inventory management"),
+    "technology": ("AI integration", "cloud migration", "cybersecurity")
+})
+
+
+@lru_cache(maxsize=128)
+def _match_industry(industry_lower: str) -> Optional[str]:
+    """Trend table key for an industry: exact match first, then partial match"""
+    if industry_lower in _INDUSTRY_TRENDS:
+        return industry_lower
+    for key in _INDUSTRY_TRENDS:
+        if key in industry_lower or industry_lower in key:
+            return key
+    return None
+
+
+def _seconds_until_midnight() -> float:
+    """Seconds from now until the next local midnight"""
+    now = datetime.now()
+    next_midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    return (next_midnight - now).total_seconds()
+
+
+# [year, time.monotonic() deadline at which to re-read it]
+_year_cache = [0, 0.0]
+
+
+def _current_year() -> int:
+    """Current local year, read from the wall clock at most once per day"""
+    if time.monotonic() >= _year_cache[1]:
+        _year_cache[:] = [datetime.now().year, time.monotonic() + _seconds_until_midnight()]
+    return _year_cache[0]
+
+
+@lru_cache(maxsize=256)
+def _default_trends(industry: str) -> Tuple[str, ...]:
+    """Generic trend topics for an industry without a trend table entry"""
+    return (f"{industry} innovation", f"{industry} automation", f"{industry} sustainability")
+
+
+@lru_cache(maxsize=256)
+def _base_topics(industry: str) -> Tuple[str, ...]:
+    """Candidate related topics for an industry"""
+    return (
+        f"{industry} cost reduction",
+        f"{industry} efficiency",
+        f"{industry} quality improvement",
+        "supply chain optimization",
+        "customer experience"
+    )
+
 
 class TrendResearchService:
     """
@@ -24,18 +97,27 @@ class TrendResearchService:
     - News aggregators
     """
     
-    def __init__(self):
-        self.api_calls_today = 0
+    # Trend results are reused for this long without spending API budget
+    TREND_CACHE_TTL = 21600  # 6 hours
+    TREND_CACHE_MAX_ENTRIES = 512
+    
+    # APICallLog.api_name for calls counted against the trend budget
+    API_NAME = "trends"
+    
+    def __init__(self, db: Optional[Session] = None):
+        # With a database, counted calls are logged to APICallLog so the
+        # daily budget survives restarts and is seen by every worker at startup
+        # (once the session owner commits)
+        self._db = db
+        self.api_calls_today = self._load_calls_today()
         self.max_api_calls = 50  # Conservative limit
+        self._schedule_next_reset()
+        
+        # {industry: (trend_data, expiry as time.monotonic() value)}, LRU order
+        self._trend_cache: "OrderedDict[str, Tuple[TrendData, float]]" = OrderedDict()
         
         # Industry-specific trend topics
-        self.industry_trends = {
-            "packaging": ["sustainable packaging", "smart packaging", "ecommerce packaging"],
-            "manufacturing": ["industry 4.0", "automation", "lean manufacturing"],
-            "logistics": ["supply chain optimization", "last mile delivery", "route optimization"],
-            "retail": ["omnichannel", "personalization", "inventory management"],
-            "technology": ["AI integration", "cloud migration", "cybersecurity"]
-        }
+        self.industry_trends = _INDUSTRY_TRENDS
         
         logger.info("TrendResearchService initialized")
     
@@ -43,8 +125,26 @@ class TrendResearchService:
         """
         Research trends for given context.
         
-        Returns None if API limits reached or research fails.
+        Returns None if API limits reached or research fails. Cached results
+        (shared between callers) are returned without using the API budget.
         """
+        # The trend topic and related topics depend only on the industry name
+        cache_key = context.industry
+        cached = self._trend_cache.get(cache_key)
+        if cached is not None:
+            trend_data, expiry = cached
+            if time.monotonic() < expiry:
+                self._trend_cache.move_to_end(cache_key)
+                logger.debug("Trend cache hit for %s", context.industry)
+                return trend_data
+            del self._trend_cache[cache_key]
+        
+        # Daily budget resets at local midnight
+        if time.monotonic() >= self._next_reset_monotonic:
+            self.api_calls_today = 0
+            self._schedule_next_reset()
+            logger.info("Trend API call count reset for new day")
+        
         if self.api_calls_today >= self.max_api_calls:
             logger.warning("Trend API call limit reached")
             return None
@@ -60,69 +160,111 @@ class TrendResearchService:
             trend_data = self._generate_trend_data(primary_topic, context)
             
             self.api_calls_today += 1
+            self._record_call()
+            
+            self._trend_cache[cache_key] = (trend_data, time.monotonic() + self.TREND_CACHE_TTL)
+            if len(self._trend_cache) > self.TREND_CACHE_MAX_ENTRIES:
+                self._trend_cache.popitem(last=False)
             
-            logger.info(f"Trend research complete: {primary_topic} ({trend_data.trend_direction})")
+            logger.info("Trend research complete: %s (%s)", primary_topic, trend_data.trend_direction)
             
             return trend_data
             
         except Exception as e:
-            logger.error(f"Trend research error: {e}")
+            logger.error("Trend research error: %s", e, exc_info=True)
             return None
     
-    def _get_industry_trends(self, industry: str) -> List[str]:
-        """Get trend topics for specific industry"""
-        industry_lower = industry.lower()
+    async def research_trends_batch(self, contexts: List[ResearchContext]) -> List[Optional[TrendData]]:
+        """
+        Research trends for several contexts.
         
-        # Try exact match first
-        if industry_lower in self.industry_trends:
-            return self.industry_trends[industry_lower]
+        Contexts with the same industry are researched once, so each unique
+        uncached industry costs one API call. Results are in input order.
+        """
+        by_industry: Dict[str, Optional[TrendData]] = {}
+        for context in contexts:
+            if context.industry not in by_industry:
+                by_industry[context.industry] = await self.research_trends(context)
         
-        # Try partial match
-        for key, trends in self.industry_trends.items():
-            if key in industry_lower or industry_lower in key:
-                return trends
+        logger.info("Trend batch: %d contexts, %d unique industries", len(contexts), len(by_industry))
+        return [by_industry[context.industry] for context in contexts]
+    
+    def _load_calls_today(self) -> int:
+        """Number of trend calls already logged today (0 without a database)"""
+        if self._db is None:
+            return 0
+        try:
+            midnight = datetime.combine(datetime.now().date(), datetime.min.time())
+            return self._db.query(func.count(APICallLog.id)).filter(
+                APICallLog.api_name == self.API_NAME,
+                APICallLog.call_date >= midnight
+            ).scalar() or 0
+        except Exception as e:
+            logger.error("Failed to load trend API call count: %s", e)
+            return 0
+    
+    def _record_call(self):
+        """
+        Log one counted trend call to APICallLog
+        
+        The row is only flushed; it is committed with the session owner's
+        transaction, so unrelated pending work is never committed early.
+        """
+        if self._db is None:
+            return
+        call_log = APICallLog(api_name=self.API_NAME, endpoint="research_trends")
+        try:
+            self._db.add(call_log)
+            self._db.flush([call_log])
+        except Exception as e:
+            logger.error("Failed to record trend API call: %s", e)
+    
+    def _schedule_next_reset(self):
+        """Set the monotonic deadline for the next daily reset (local midnight)"""
+        self._next_reset_monotonic = time.monotonic() + _seconds_until_midnight()
+    
+    def _get_industry_trends(self, industry: str) -> Tuple[str, ...]:
+        """Get trend topics for specific industry (read-only tuple)"""
+        key = _match_industry(industry.lower())
+        if key is not None:
+            return self.industry_trends[key]
         
         # Default trends
-        return [f"{industry} innovation", f"{industry} automation", f"{industry} sustainability"]
+        return _default_trends(industry)
     
     def _generate_trend_data(self, topic: str, context: ResearchContext) -> TrendData:
         """Generate trend data with realistic patterns"""
         
         # Determine trend direction based on topic keywords
-        rising_keywords = ['sustainable', 'smart', 'automation', 'ai', 'digital', 'innovation']
-        declining_keywords = ['traditional', 'manual', 'legacy']
-        
         topic_lower = topic.lower()
         
-        if any(kw in topic_lower for kw in rising_keywords):
-            direction = "rising"
-            growth_rate = 15.0 + hash(topic) % 20  # 15-35%
-        elif any(kw in topic_lower for kw in declining_keywords):
-            direction = "declining"
-            growth_rate = -5.0 - hash(topic) % 10  # -5 to -15%
-        else:
-            direction = "stable"
-            growth_rate = 2.0 + hash(topic) % 8  # 2-10%
+        # Deterministic per-topic seed (str hash() is salted per process)
+        seed = zlib.crc32(topic.encode("utf-8"))
+        
+        direction, base_rate, span, sign = next(
+            (rule[1:] for rule in _DIRECTION_RULES if rule[0].search(topic_lower)),
+            _DEFAULT_DIRECTION
+        )
+        growth_rate = base_rate + sign * (seed % span)
         
         # Generate related topics
-        base_topics = [
-            f"{context.industry} cost reduction",
-            f"{context.industry} efficiency",
-            f"{context.industry} quality improvement",
-            "supply chain optimization",
-            "customer experience"
-        ]
+        base_topics = _base_topics(context.industry)
         
-        # Select 3 related topics based on hash for consistency
-        related = [base_topics[hash(topic + str(i)) % len(base_topics)] for i in range(3)]
-        related = list(set(related))  # Remove duplicates
+        # Select 3 related topics from separate bytes of the seed for consistency,
+        # dropping repeats (compared by index, keeping first-seen order)
+        first, second, third = (((seed >> (i * 8)) & 0xFF) % len(base_topics) for i in range(3))
+        related = [base_topics[first]]
+        if second != first:
+            related.append(base_topics[second])
+        if third != first and third != second:
+            related.append(base_topics[third])
         
         # Add data points
         data_points = [
             {
-                "year": datetime.now().year,
+                "year": _current_year(),
                 "growth_rate": growth_rate,
-                "adoption_percentage": 25 + hash(topic) % 50
+                "adoption_percentage": 25 + seed % 50
             },
             {
                 "metric": "search_volume_increase",
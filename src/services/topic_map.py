@@ -17,6 +17,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 from collections import defaultdict
+from functools import lru_cache
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
@@ -164,6 +165,14 @@ class TopicMapService:
         ]
     }
     
+    # INTENT_SIGNALS flattened to (signal, intent index) for a single scan
+    _INTENTS = tuple(INTENT_SIGNALS)
+    _SIGNAL_TABLE = tuple(
+        (signal, index)
+        for index, signals in enumerate(INTENT_SIGNALS.values())
+        for signal in signals
+    )
+    
     # Similarity thresholds
     HIGH_SIMILARITY_THRESHOLD = 0.8
     CANNIBALIZATION_THRESHOLD = 0.7
@@ -305,19 +314,26 @@ class TopicMapService:
     
     def classify_intent(self, keyword: str, title: str = "") -> SearchIntent:
         """Classify search intent from keyword and title"""
+        return self._classify_intent_cached(keyword, title)
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _classify_intent_cached(keyword: str, title: str) -> SearchIntent:
+        """Intent for a (keyword, title) pair, memoized across calls and instances"""
+        cls = TopicMapService
         text = f"{keyword} {title}".lower()
         
-        # Score each intent
-        intent_scores = defaultdict(int)
+        # Score each intent in one pass over the flattened signal table
+        intent_scores = [0] * len(cls._INTENTS)
         
-        for intent, signals in self.INTENT_SIGNALS.items():
-            for signal in signals:
-                if signal in text:
-                    intent_scores[intent] += 1
+        for signal, index in cls._SIGNAL_TABLE:
+            if signal in text:
+                intent_scores[index] += 1
         
-        if intent_scores:
-            best_intent = max(intent_scores.keys(), key=lambda k: intent_scores[k])
-            return best_intent
+        # Ties go to the intent listed first in INTENT_SIGNALS
+        best_score = max(intent_scores)
+        if best_score:
+            return cls._INTENTS[intent_scores.index(best_score)]
         
         # Default to informational
         return SearchIntent.INFORMATIONAL
@@ -735,13 +751,11 @@ class TopicMapService:
                 ))
         
         # 2. Group by intent
-        intent_groups = {}
         all_semantic_pages = spoke_pages + ([hub_page] if hub_page else [])
+        intent_groups = {intent.value: [] for intent in SearchIntent}
         
-        for intent in SearchIntent:
-            intent_groups[intent.value] = [
-                p for p in all_semantic_pages if p.intent == intent
-            ]
+        for p in all_semantic_pages:
+            intent_groups[p.intent.value].append(p)
         
         # 3. Find orphan pages (no inbound links and not the hub)
         orphan_pages = [
@@ -0,0 +1,102 @@
+"""
+Unit tests for Keyword Strategy
+
+Tests semantic diversity filtering of keyword candidates.
+"""
+
+import pytest
+
+from src.services.keyword_strategy import (
+    ContentAwareKeywordGenerator,
+    CustomerJourneyStage,
+    KeywordCandidate,
+    SearchIntent
+)
+
+
+def make_candidate(keyword: str) -> KeywordCandidate:
+    """Create a keyword candidate with fixed metadata"""
+    return KeywordCandidate(
+        keyword=keyword,
+        intent=SearchIntent.COMMERCIAL,
+        journey_stage=CustomerJourneyStage.CONSIDERATION,
+        category="glass bottles",
+        difficulty_estimate="medium",
+        is_long_tail=True,
+        semantic_group="consideration_glass bottles"
+    )
+
+
+class TestSemanticDiversityFilter:
+    """Unit tests for filter_by_semantic_diversity"""
+
+    @pytest.fixture
+    def generator(self):
+        """Create a generator without a website profile"""
+        return ContentAwareKeywordGenerator()
+
+    @pytest.fixture
+    def candidates(self):
+        """Create a fixed candidate set"""
+        return [
+            make_candidate("custom glass bottles supplier"),   # shares "custom glass bottles"
+            make_candidate("bottles wholesale pricing"),       # shares "bottles wholesale"
+            make_candidate("wholesale custom bottles"),        # same words, no shared phrase
+            make_candidate("glass jars for cosmetics"),        # shares "glass"
+            make_candidate("amber dropper bottle guide"),      # nothing shared
+        ]
+
+    def test_no_selected_keywords_keeps_all(self, generator, candidates):
+        """Test every candidate passes when nothing is selected yet"""
+        # Act
+        result = generator.filter_by_semantic_diversity(candidates, [], min_diversity_score=0.4)
+
+        # Assert
+        assert result == candidates
+
+    def test_kept_and_dropped_keywords(self, generator, candidates):
+        """Test which candidates pass at the scheduler's threshold"""
+        # Act
+        result = generator.filter_by_semantic_diversity(
+            candidates, ["custom glass bottles wholesale"], min_diversity_score=0.4
+        )
+
+        # Assert
+        assert [c.keyword for c in result] == [
+            "wholesale custom bottles",
+            "glass jars for cosmetics",
+            "amber dropper bottle guide",
+        ]
+
+    def test_shared_phrase_counts_consecutive_words_only(self, generator):
+        """Test overlap is the longest shared run of words, not shared word count"""
+        # Arrange - every word is in a selected keyword, but at most two in a row
+        shuffled = make_candidate("bottles glass custom wholesale")
+        phrase = make_candidate("glass bottles custom order")
+
+        # Act
+        result = generator.filter_by_semantic_diversity(
+            [shuffled, phrase], ["custom glass bottles wholesale"], min_diversity_score=0.5
+        )
+
+        # Assert - runs of 1 (diversity 0.75) pass; "glass bottles" (0.5) just passes
+        assert result == [shuffled, phrase]
+
+        # A stricter threshold drops the candidate sharing a two-word phrase
+        result = generator.filter_by_semantic_diversity(
+            [shuffled, phrase], ["custom glass bottles wholesale"], min_diversity_score=0.6
+        )
+        assert result == [shuffled]
+
+    def test_phrases_across_selected_keywords_do_not_join(self, generator):
+        """Test a phrase must come from a single selected keyword"""
+        # Arrange - "bottle caps" ends one keyword and "wholesale" starts another
+        candidate = make_candidate("bottle caps wholesale")
+
+        # Act
+        result = generator.filter_by_semantic_diversity(
+            [candidate], ["plastic bottle caps", "wholesale jars"], min_diversity_score=0.3
+        )
+
+        # Assert - longest shared run is "bottle caps" (diversity 1/3), not all 3 words
+        assert result == [candidate]
@@ -0,0 +1,84 @@
+"""
+Unit tests for Quality Gate
+
+Tests similarity scoring against a fixed corpus.
+"""
+
+import pytest
+
+from src.services.quality_gate import EnhancedQualityGate
+
+
+CORPUS = [
+    {
+        "id": "boxes",
+        "url": "/boxes",
+        "content": (
+            "<h1>Corrugated Boxes</h1><p>Corrugated boxes protect products during shipping. "
+            "Double wall board handles heavier loads than single wall board. "
+            "Most suppliers quote prices per thousand units.</p>"
+        )
+    },
+    {
+        "id": "labels",
+        "url": "/labels",
+        "content": (
+            "<h1>Label Printing</h1><p>Digital label printing suits short runs with many designs. "
+            "Flexographic printing lowers the unit cost once volumes grow. "
+            "Matte and gloss finishes change how colors appear.</p>"
+        )
+    },
+    {
+        "id": "pallets",
+        "url": "/pallets",
+        "content": (
+            "<h1>Pallet Wrapping</h1><p>Stretch film keeps pallet loads stable in the warehouse. "
+            "Pre-stretched film uses less plastic per pallet. "
+            "Machine wrapping gives consistent tension on every load.</p>"
+        )
+    },
+]
+
+UNRELATED_CONTENT = (
+    "<h1>Glass Bottles</h1><h2>Why glass</h2><p>Glass bottles keep flavors neutral and can be "
+    "recycled many times. Amber glass blocks light for sensitive products. Buyers usually compare "
+    "weight, closure type and minimum order quantity before choosing a supplier.</p>"
+)
+
+
+class TestQualityGateSimilarity:
+    """Unit tests for EnhancedQualityGate similarity analysis"""
+
+    @pytest.fixture
+    def gate(self):
+        """Create an EnhancedQualityGate instance"""
+        return EnhancedQualityGate()
+
+    @pytest.mark.asyncio
+    async def test_unrelated_content_reports_closest_match(self, gate):
+        """Test content unrelated to the corpus still gets its best match scored"""
+        # Act
+        diagnostic = await gate.full_diagnostic(
+            UNRELATED_CONTENT, "bottles", CORPUS, target_keyword="glass bottles"
+        )
+
+        # Assert
+        match = diagnostic.similarity_analysis
+        assert match is not None
+        assert match.matched_content_id == "boxes"
+        assert match.overall_similarity == pytest.approx(0.1036, abs=1e-4)
+        assert diagnostic.overall_score == pytest.approx(80.91, abs=0.01)
+        assert diagnostic.grade == "B"
+
+    @pytest.mark.asyncio
+    async def test_exact_duplicate_is_flagged(self, gate):
+        """Test an exact copy of a corpus document is a critical duplicate"""
+        # Act
+        diagnostic = await gate.full_diagnostic(CORPUS[1]["content"], "copy", CORPUS)
+
+        # Assert
+        match = diagnostic.similarity_analysis
+        assert match.matched_content_id == "labels"
+        assert match.is_duplicate
+        assert any(issue.issue_id == "SIM-001" for issue in diagnostic.issues)
+        assert not diagnostic.can_publish
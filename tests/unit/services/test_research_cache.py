@@ -6,9 +6,13 @@ Tests three-tier cache functionality.
 
 import pytest
 import json
+import time
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
 from src.services.research.cache import ResearchCache
 from src.models.content_intelligence import ResearchCacheEntry
 
@@ -104,8 +108,37 @@ class TestResearchCache:
         assert result == test_data
         stats = cache.get_stats()
         assert stats["db_hits"] == 1
-        # Should update access stats
-        assert cache_entry.access_count == 1
+        # Access stats are written before get() returns
+        mock_db.execute.assert_called_once()
+        mock_db.commit.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_l3_hit_persists_access_stats(self):
+        """Test a plain L3 hit writes access_count and last_accessed_at"""
+        # Arrange
+        engine = create_engine("sqlite:///:memory:")
+        ResearchCacheEntry.__table__.create(engine)
+        Session = sessionmaker(bind=engine)
+        with Session() as seed:
+            seed.add(ResearchCacheEntry(
+                cache_key="db_key",
+                data=json.dumps({"value": 1}),
+                context_hash="test",
+                expires_at=datetime.now() + timedelta(days=1),
+                access_count=0
+            ))
+            seed.commit()
+        
+        # Act
+        with Session() as db:
+            result = await ResearchCache(db=db).get("db_key")
+        
+        # Assert
+        assert result == {"value": 1}
+        with Session() as check:
+            entry = check.query(ResearchCacheEntry).filter_by(cache_key="db_key").one()
+            assert entry.access_count == 1
+            assert entry.last_accessed_at is not None
     
     @pytest.mark.asyncio
     async def test_complete_cache_miss(self, cache):
@@ -140,7 +173,7 @@ class TestResearchCache:
     async def test_delete_removes_all_levels(self, cache, mock_db, mock_redis):
         """Test that delete removes from all levels"""
         # Arrange
-        cache.memory_cache["del_key"] = ({"data": "test"}, datetime.now())
+        cache.memory_cache["del_key"] = ({"data": "test"}, time.monotonic())
         
         # Act
         await cache.delete("del_key")
@@ -154,10 +187,10 @@ class TestResearchCache:
     async def test_cleanup_expired_entries(self, cache, mock_db):
         """Test cleanup removes expired entries"""
         # Arrange
-        now = datetime.now()
-        cache.memory_cache["fresh"] = ({"data": 1}, now + timedelta(hours=1))
-        cache.memory_cache["expired"] = ({"data": 2}, now - timedelta(hours=1))
-        cache.memory_cache["also_expired"] = ({"data": 3}, now - timedelta(minutes=5))
+        now = time.monotonic()
+        cache.memory_cache["fresh"] = ({"data": 1}, now + 3600)
+        cache.memory_cache["expired"] = ({"data": 2}, now - 3600)
+        cache.memory_cache["also_expired"] = ({"data": 3}, now - 300)
         
         expired_db_entry = Mock()
         mock_db.query.return_value.filter.return_value.delete.return_value = 5